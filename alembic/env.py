@@ -17,7 +17,7 @@ from app.core.config import settings
 from app.core.database import Base
 
 # Import all models so they are registered with Base.metadata
-from app.models import User, Job, AppliedJob
+from app.models import User, Job, AppliedJob, JobArchive, JobFacetCount
 
 # This is the Alembic Config object
 config = context.config
@@ -0,0 +1,31 @@
+"""Add job listing index
+
+Revision ID: 5c1d8a4e9f02
+Revises: 3b9e2f71c4a8
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1d8a4e9f02'
+down_revision: Union[str, None] = '3b9e2f71c4a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches the keyset pagination order of GET /jobs
+    op.create_index(
+        'ix_jobs_posted_date_id',
+        'jobs',
+        [sa.text('posted_date DESC NULLS LAST'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_posted_date_id', table_name='jobs')
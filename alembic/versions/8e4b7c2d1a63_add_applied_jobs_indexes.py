@@ -0,0 +1,45 @@
+"""Add applied jobs indexes
+
+Revision ID: 8e4b7c2d1a63
+Revises: 5c1d8a4e9f02
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b7c2d1a63'
+down_revision: Union[str, None] = '5c1d8a4e9f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the earliest application where a user applied to a job twice
+    op.execute("""
+        DELETE FROM applied_jobs
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM applied_jobs GROUP BY user_id, job_id
+        )
+    """)
+    with op.batch_alter_table('applied_jobs') as batch_op:
+        batch_op.create_unique_constraint('uq_applied_jobs_user_job', ['user_id', 'job_id'])
+    op.create_index(
+        'ix_applied_jobs_user_applied_at',
+        'applied_jobs',
+        ['user_id', sa.text('applied_at DESC')],
+        postgresql_include=['id', 'job_id'],
+    )
+    # Covered by the two (user_id, ...) indexes above
+    op.drop_index(op.f('ix_applied_jobs_user_id'), table_name='applied_jobs')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_applied_jobs_user_id'), 'applied_jobs', ['user_id'], unique=False)
+    op.drop_index('ix_applied_jobs_user_applied_at', table_name='applied_jobs')
+    with op.batch_alter_table('applied_jobs') as batch_op:
+        batch_op.drop_constraint('uq_applied_jobs_user_job', type_='unique')
@@ -0,0 +1,49 @@
+"""Add jobs archive
+
+Revision ID: a47f3e9c6b15
+Revises: 8e4b7c2d1a63
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a47f3e9c6b15'
+down_revision: Union[str, None] = '8e4b7c2d1a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Range-partitioned by month of created_at; monthly partitions are
+    # created by the archival task as it needs them
+    op.create_table('jobs_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('company', sa.String(length=255), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('platform', sa.String(length=100), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('apply_url', sa.String(length=500), nullable=True),
+    sa.Column('posted_date', sa.DateTime(), nullable=True),
+    sa.Column('experience_level', sa.String(length=50), nullable=True),
+    sa.Column('salary_range', sa.String(length=100), nullable=True),
+    sa.Column('dedup_key', sa.String(length=64), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'created_at', name='pk_jobs_archive'),
+    postgresql_partition_by='RANGE (created_at)',
+    )
+    op.create_index(op.f('ix_jobs_archive_dedup_key'), 'jobs_archive', ['dedup_key'], unique=False)
+    op.execute("CREATE TABLE jobs_archive_default PARTITION OF jobs_archive DEFAULT")
+
+
+def downgrade() -> None:
+    # Dropping the parent drops every partition with it
+    op.drop_index(op.f('ix_jobs_archive_dedup_key'), table_name='jobs_archive')
+    op.drop_table('jobs_archive')
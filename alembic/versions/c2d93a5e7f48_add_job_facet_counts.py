@@ -0,0 +1,47 @@
+"""Add job facet counts
+
+Revision ID: c2d93a5e7f48
+Revises: a47f3e9c6b15
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d93a5e7f48'
+down_revision: Union[str, None] = 'a47f3e9c6b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('job_facet_counts',
+    sa.Column('facet', sa.String(length=32), nullable=False),
+    sa.Column('value', sa.String(length=255), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('facet', 'value', name='pk_job_facet_counts'),
+    )
+
+    # Backfill from the existing jobs; the application keeps it current
+    op.execute("""
+        INSERT INTO job_facet_counts (facet, value, count)
+        SELECT 'platform', COALESCE(platform, ''), COUNT(*) FROM jobs GROUP BY COALESCE(platform, '')
+        UNION ALL
+        SELECT 'location', COALESCE(location, ''), COUNT(*) FROM jobs GROUP BY COALESCE(location, '')
+        UNION ALL
+        SELECT 'experience_level', COALESCE(experience_level, ''), COUNT(*) FROM jobs
+        GROUP BY COALESCE(experience_level, '')
+        UNION ALL
+        SELECT 'posted_day', COALESCE(to_char(posted_date, 'YYYY-MM-DD'), ''), COUNT(*) FROM jobs
+        GROUP BY COALESCE(to_char(posted_date, 'YYYY-MM-DD'), '')
+        UNION ALL
+        SELECT 'total', '', COUNT(*) FROM jobs
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('job_facet_counts')
@@ -0,0 +1,84 @@
+"""Add job dedup key
+
+Revision ID: ed636dcc9f81
+Revises: d749a937c09c
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import hashlib
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ed636dcc9f81'
+down_revision: Union[str, None] = 'd749a937c09c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def job_dedup_key(title, company, location):
+    # Frozen copy of app.models.job.job_dedup_key
+    normalized = "|".join((value or "").strip().lower() for value in (title, company, location))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('dedup_key', sa.String(length=64), nullable=True))
+
+    # Backfill with the same hash the application computes
+    conn = op.get_bind()
+    jobs = sa.table(
+        'jobs',
+        sa.column('id', sa.Integer),
+        sa.column('title', sa.String),
+        sa.column('company', sa.String),
+        sa.column('location', sa.String),
+        sa.column('dedup_key', sa.String),
+    )
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(jobs.c.id, jobs.c.title, jobs.c.company, jobs.c.location)
+            .where(jobs.c.id > last_id)
+            .order_by(jobs.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            jobs.update().where(jobs.c.id == sa.bindparam('job_id')),
+            [
+                {'job_id': row.id, 'dedup_key': job_dedup_key(row.title, row.company, row.location)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    # Merge existing duplicates into the oldest row before enforcing uniqueness
+    op.execute("""
+        CREATE TEMPORARY TABLE job_duplicates AS
+        SELECT j.id AS duplicate_id, keep.id AS keep_id
+        FROM jobs j
+        JOIN (SELECT dedup_key, MIN(id) AS id FROM jobs GROUP BY dedup_key) keep
+          ON keep.dedup_key = j.dedup_key AND keep.id <> j.id
+    """)
+    op.execute("""
+        UPDATE applied_jobs SET job_id = d.keep_id
+        FROM job_duplicates d
+        WHERE applied_jobs.job_id = d.duplicate_id
+    """)
+    op.execute("DELETE FROM jobs WHERE id IN (SELECT duplicate_id FROM job_duplicates)")
+    op.execute("DROP TABLE job_duplicates")
+
+    op.alter_column('jobs', 'dedup_key', nullable=False)
+    op.create_index(op.f('ix_jobs_dedup_key'), 'jobs', ['dedup_key'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_jobs_dedup_key'), table_name='jobs')
+    op.drop_column('jobs', 'dedup_key')
@@ -0,0 +1,46 @@
+"""Page applied jobs by (applied_at, id)
+
+Revision ID: f1a6c83d2b97
+Revises: c2d93a5e7f48
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a6c83d2b97'
+down_revision: Union[str, None] = 'c2d93a5e7f48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Cursors can't point at a NULL applied_at
+    op.execute("UPDATE applied_jobs SET applied_at = CURRENT_TIMESTAMP WHERE applied_at IS NULL")
+    with op.batch_alter_table('applied_jobs') as batch_op:
+        batch_op.alter_column('applied_at', existing_type=sa.DateTime(), nullable=False)
+
+    # id becomes a key column so keyset pages seek straight to the cursor
+    op.drop_index('ix_applied_jobs_user_applied_at', table_name='applied_jobs')
+    op.create_index(
+        'ix_applied_jobs_user_applied_at',
+        'applied_jobs',
+        ['user_id', sa.text('applied_at DESC'), sa.text('id DESC')],
+        postgresql_include=['job_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applied_jobs_user_applied_at', table_name='applied_jobs')
+    op.create_index(
+        'ix_applied_jobs_user_applied_at',
+        'applied_jobs',
+        ['user_id', sa.text('applied_at DESC')],
+        postgresql_include=['id', 'job_id'],
+    )
+    with op.batch_alter_table('applied_jobs') as batch_op:
+        batch_op.alter_column('applied_at', existing_type=sa.DateTime(), nullable=True)
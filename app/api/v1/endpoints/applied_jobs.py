@@ -1,101 +1,204 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Literal, Optional
 
-from app.core.database import get_db
-from app.core.security import get_current_user
+from app.core.database import conflict_insert, get_async_db
+from app.core.replicas import get_user_read_db, replica_router
+from app.core.principals import Principal, get_current_principal
 from app.models.job import Job
 from app.models.applied_job import AppliedJob
 from app.schemas.applied_job import (
     AppliedJobCreate,
     AppliedJobResponse,
     AppliedJobListResponse,
+    AppliedJobBatchCreate,
+    AppliedJobBatchResult,
+    AppliedJobBatchResponse,
 )
+from app.services.job_search import job_list_columns
+from app.services.pagination import InvalidCursorError, decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/applied-jobs", tags=["Applied Jobs"])
 
 
 @router.get("", response_model=AppliedJobListResponse)
 async def list_applied_jobs(
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_user_read_db),
+    principal: Principal = Depends(get_current_principal),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
+    job: Literal["full", "summary", "none"] = "full",
 ):
     """
-    List all jobs the current user has applied to.
+    List the jobs the current user has applied to, newest first.
+    
+    Pages hold up to limit applications; pass next_cursor back as cursor
+    for the next page. Each application embeds its job from the same
+    query: job=summary leaves out the description, job=none embeds
+    nothing (job_id is always set).
     """
-    user_id = int(current_user["user_id"])
+    user_id = principal.id
     
-    applied_jobs = (
-        db.query(AppliedJob)
-        .filter(AppliedJob.user_id == user_id)
-        .order_by(AppliedJob.applied_at.desc())
-        .all()
+    application_columns = [AppliedJob.id, AppliedJob.job_id, AppliedJob.applied_at]
+    job_columns = [] if job == "none" else job_list_columns("none" if job == "summary" else "full")
+    stmt = (
+        select(*application_columns, *job_columns)
+        .where(AppliedJob.user_id == user_id)
+        .order_by(AppliedJob.applied_at.desc(), AppliedJob.id.desc())
+        .limit(limit + 1)
     )
+    if job_columns:
+        stmt = stmt.join(Job, Job.id == AppliedJob.job_id)
+    if cursor is not None:
+        try:
+            applied_at, applied_job_id = decode_cursor(cursor, datetime, int)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        stmt = stmt.where(tuple_(AppliedJob.applied_at, AppliedJob.id) < (applied_at, applied_job_id))
+    
+    rows = (await db.execute(stmt)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].applied_at, rows[-1].id)
+    
+    job_fields = [column.key for column in job_columns]
+    applied_jobs = [
+        AppliedJobResponse(
+            id=row[0],
+            job_id=row[1],
+            applied_at=row[2],
+            job=dict(zip(job_fields, row[3:])) if job_columns else None,
+        )
+        for row in rows
+    ]
+    
+    total = await db.scalar(select(func.count(AppliedJob.id)).where(AppliedJob.user_id == user_id))
     
     return AppliedJobListResponse(
         applied_jobs=applied_jobs,
-        total=len(applied_jobs)
+        total=total,
+        next_cursor=next_cursor,
     )
 
 
+# FOR KEY SHARE on the jobs being applied to. The archiver locks the jobs
+# it moves FOR UPDATE SKIP LOCKED, so it passes over jobs being applied
+# to, and an apply racing a batch sees the job gone (404) instead of
+# failing the applied_jobs foreign key.
+JOB_KEY_SHARE = {"read": True, "key_share": True}
+
+
 @router.post("", response_model=AppliedJobResponse, status_code=status.HTTP_201_CREATED)
 async def apply_to_job(
     request: AppliedJobCreate,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(get_current_principal),
 ):
     """
     Apply to a job. Records the application in the database.
     """
-    user_id = int(current_user["user_id"])
+    user_id = principal.id
     
-    # Check if job exists
-    job = db.query(Job).filter(Job.id == request.job_id).first()
+    # Check if job exists, locking it against archival until commit
+    job = await db.get(Job, request.job_id, with_for_update=JOB_KEY_SHARE)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found"
         )
     
-    # Check if already applied
-    existing = db.query(AppliedJob).filter(
-        AppliedJob.user_id == user_id,
-        AppliedJob.job_id == request.job_id
-    ).first()
+    # Create application; the unique (user_id, job_id) constraint rejects
+    # repeats, including concurrent ones
+    applied_job = await db.scalar(
+        conflict_insert(db, AppliedJob)
+        .values(user_id=user_id, job_id=request.job_id)
+        .on_conflict_do_nothing(index_elements=[AppliedJob.user_id, AppliedJob.job_id])
+        .returning(AppliedJob)
+    )
+    await db.commit()
+    replica_router.note_write(user_id)
     
-    if existing:
+    if applied_job is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You have already applied to this job"
         )
+    set_committed_value(applied_job, "job", job)
     
-    # Create application
-    applied_job = AppliedJob(
-        user_id=user_id,
-        job_id=request.job_id
-    )
+    return applied_job
+
+
+@router.post("/batch", response_model=AppliedJobBatchResponse)
+async def apply_to_jobs(
+    request: AppliedJobBatchCreate,
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(get_current_principal),
+):
+    """
+    Apply to several jobs at once.
     
-    db.add(applied_job)
-    db.commit()
-    db.refresh(applied_job)
+    Returns one result per distinct job id, in request order: applied,
+    already_applied or not_found. Takes two queries however many jobs
+    are in the batch.
+    """
+    user_id = principal.id
+    job_ids = list(dict.fromkeys(request.job_ids))
     
-    return applied_job
+    existing = set(await db.scalars(
+        select(Job.id).where(Job.id.in_(job_ids)).with_for_update(**JOB_KEY_SHARE)
+    ))
+    
+    created = {}
+    if existing:
+        applied_at = datetime.now(timezone.utc)
+        rows = await db.execute(
+            conflict_insert(db, AppliedJob)
+            .values([
+                {"user_id": user_id, "job_id": job_id, "applied_at": applied_at}
+                for job_id in job_ids if job_id in existing
+            ])
+            .on_conflict_do_nothing(index_elements=[AppliedJob.user_id, AppliedJob.job_id])
+            .returning(AppliedJob.id, AppliedJob.job_id, AppliedJob.applied_at)
+        )
+        created = {row.job_id: row for row in rows}
+        await db.commit()
+        if created:
+            replica_router.note_write(user_id)
+    
+    results = []
+    for job_id in job_ids:
+        if job_id in created:
+            row = created[job_id]
+            results.append(AppliedJobBatchResult(
+                job_id=job_id, status="applied", id=row.id, applied_at=row.applied_at,
+            ))
+        elif job_id in existing:
+            results.append(AppliedJobBatchResult(job_id=job_id, status="already_applied"))
+        else:
+            results.append(AppliedJobBatchResult(job_id=job_id, status="not_found"))
+    
+    return AppliedJobBatchResponse(results=results, applied=len(created))
 
 
 @router.delete("/{applied_job_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_application(
     applied_job_id: int,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(get_current_principal),
 ):
     """
     Remove a job application.
     """
-    user_id = int(current_user["user_id"])
+    user_id = principal.id
     
-    applied_job = db.query(AppliedJob).filter(
+    applied_job = await db.scalar(select(AppliedJob).where(
         AppliedJob.id == applied_job_id,
         AppliedJob.user_id == user_id
-    ).first()
+    ))
     
     if not applied_job:
         raise HTTPException(
@@ -103,5 +206,6 @@ async def remove_application(
             detail="Application not found"
         )
     
-    db.delete(applied_job)
-    db.commit()
+    await db.delete(applied_job)
+    await db.commit()
+    replica_router.note_write(user_id)
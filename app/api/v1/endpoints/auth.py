@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.security import (
-    get_password_hash,
-    verify_password,
-    create_access_token,
-)
+from app.core.database import get_async_db
+from app.core.hashing import password_hasher
+from app.core.principals import Principal, get_current_principal, user_cache
+from app.core.replicas import replica_router
+from app.core.security import create_access_token
 from app.models.user import User
 from app.schemas.user import (
     UserResponse,
@@ -19,12 +19,12 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(request: SignupRequest, db: Session = Depends(get_db)):
+async def signup(request: SignupRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Register a new user account.
     """
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == request.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == request.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -35,26 +35,30 @@ async def signup(request: SignupRequest, db: Session = Depends(get_db)):
     user = User(
         email=request.email,
         name=request.name,
-        password_hash=get_password_hash(request.password),
+        password_hash=await password_hasher.hash(request.password),
     )
     
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    replica_router.note_write(user.id)
     
     return user
 
 
 @router.post("/login", response_model=Token)
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+async def login(request: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Login with email and password.
     Returns a JWT access token.
     """
     # Find user by email
-    user = db.query(User).filter(User.email == request.email).first()
+    user = await db.scalar(select(User).where(User.email == request.email))
     
-    if not user or not verify_password(request.password, user.password_hash):
+    valid, new_hash = False, None
+    if user:
+        valid, new_hash = await password_hasher.verify_and_update(request.password, user.password_hash)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -68,6 +72,11 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
             detail="User account is disabled"
         )
     
+    # Upgrade a hash made with an older BCRYPT_ROUNDS
+    if new_hash is not None:
+        user.password_hash = new_hash
+        await db.commit()
+    
     # Create access token
     access_token = create_access_token(subject=user.id)
     
@@ -75,17 +84,22 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(__import__("app.core.security", fromlist=["get_current_user"]).get_current_user),
-):
+async def get_current_user_info(principal: Principal = Depends(get_current_principal)):
     """
     Get current authenticated user info.
     """
-    user = db.query(User).filter(User.id == int(current_user["user_id"])).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    return user
+    return principal
+
+
+@router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
+async def deactivate_account(
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(get_current_principal),
+):
+    """
+    Deactivate the current account. Its tokens stop working and it can
+    no longer log in.
+    """
+    await db.execute(update(User).where(User.id == principal.id).values(is_active=False))
+    await db.commit()
+    user_cache.invalidate(principal.id)
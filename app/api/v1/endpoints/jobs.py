@@ -1,93 +1,366 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
+import json
+import orjson
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_async_db, AsyncSessionLocal
+from app.core.replicas import get_read_db
 from app.models.job import Job
-from app.schemas.job import JobResponse, JobListResponse, JobCreate
-from app.services.scraping import ScraperManager
+from app.schemas.job import JobResponse, JobListResponse, JobCreate, JobFacetsResponse
+from app.schemas.task import ScrapeTaskResponse
+from app.services.etags import etag_matches, make_etag, not_modified
+from app.services.facets import job_facets
+from app.services.ingest import save_scraped_jobs
+from app.services.job_search import (
+    DATE_ORDER,
+    CountMode,
+    DescriptionMode,
+    apply_job_filters,
+    count_jobs,
+    job_list_columns,
+    job_list_rows,
+    page_by_date,
+    relevance,
+)
+from app.services.pagination import InvalidCursorError
+from app.services.query_cache import QueryResultCache, get_job_list_cache
+from app.services.scraping import scraper_manager
+from app.services.tasks import scrape_task_queue, QueueFullError, ScrapeTask, TaskStatus
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
 
+def validate_platforms(platforms: Optional[List[str]]):
+    """Reject platform names no registered scraper handles"""
+    if not platforms:
+        return
+    known = {scraper.platform_name.lower() for scraper in scraper_manager.scrapers}
+    unknown = [p for p in platforms if p.lower() not in known]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown platforms: {', '.join(unknown)}"
+        )
+
+
+def task_response(task: ScrapeTask, deduplicated: bool = False) -> ScrapeTaskResponse:
+    return ScrapeTaskResponse(
+        task_id=task.id,
+        status=task.status.value,
+        query=task.query,
+        location=task.location,
+        platforms=task.platforms,
+        created_at=task.created_at,
+        started_at=task.started_at,
+        finished_at=task.finished_at,
+        new_jobs=len(task.job_ids),
+        error=task.error,
+        deduplicated=deduplicated,
+    )
+
+
+def normalize_search(value: Optional[str]) -> Optional[str]:
+    """Collapse whitespace so equivalent searches share a cache entry"""
+    value = " ".join(value.split()) if value else None
+    return value or None
+
+
 @router.get("", response_model=JobListResponse)
 async def list_jobs(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    cache: QueryResultCache = Depends(get_job_list_cache),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     query: Optional[str] = None,
     location: Optional[str] = None,
+    sort: Literal["date", "relevance"] = "date",
+    cursor: Optional[str] = None,
+    total: CountMode = "exact",
+    description: DescriptionMode = "full",
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     List all available jobs with pagination.
+    
+    query searches title, company and description. sort=relevance ranks
+    search matches (Postgres only; otherwise newest first).
+    
+    With sort=date every page returns next_cursor; pass it back as cursor
+    to fetch the next page without an OFFSET scan (skip is then ignored).
+    total=estimated returns an approximate count, total=none skips it.
+    description=snippet shortens each description to its first few
+    hundred characters and description=none leaves it out.
+    
+    Responses are cached until new jobs are stored; the X-Cache header
+    says whether this one was. A matching If-None-Match gets a 304 with
+    no body. With the result cache on Redis the ETag follows the cache
+    generation, so the 304 is answered before the listing is queried;
+    otherwise the ETag is a hash of the body.
     """
-    jobs_query = db.query(Job)
+    dialect_name = db.bind.dialect.name
+    query = normalize_search(query)
+    # Location is matched case-insensitively
+    location = normalize_search(location.lower()) if location else None
+    by_relevance = bool(sort == "relevance" and query and dialect_name == "postgresql")
+    if cursor is not None and by_relevance:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor is only supported with sort=date"
+        )
     
-    # Filter by title/company if query provided
-    if query:
-        jobs_query = jobs_query.filter(
-            (Job.title.ilike(f"%{query}%")) | 
-            (Job.company.ilike(f"%{query}%"))
+    async def fetch() -> bytes:
+        stmt = apply_job_filters(
+            select(*job_list_columns(description)), dialect_name, query=query, location=location
         )
+        job_count = await count_jobs(db, stmt, total)
+        next_cursor = None
+        if by_relevance:
+            rows = (await db.execute(
+                stmt.order_by(relevance(query).desc(), *DATE_ORDER)
+                .offset(skip)
+                .limit(limit)
+            )).all()
+        else:
+            try:
+                rows, next_cursor = await page_by_date(db, stmt, limit, cursor=cursor, skip=skip)
+            except InvalidCursorError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        
+        # Plain rows serialized directly, without ORM entities or JobResponse models
+        return orjson.dumps({
+            "jobs": job_list_rows(rows, description),
+            "total": job_count,
+            "total_estimated": total == "estimated",
+            "next_cursor": next_cursor,
+        })
     
-    # Filter by location if provided
-    if location:
-        jobs_query = jobs_query.filter(Job.location.ilike(f"%{location}%"))
+    key = cache.key(
+        "list",
+        query=query,
+        location=location,
+        sort="relevance" if by_relevance else "date",
+        cursor=cursor,
+        skip=0 if cursor is not None else skip,
+        limit=limit,
+        total=total,
+        description=description,
+    )
+    cache_control = f"public, max-age={settings.JOB_LIST_MAX_AGE}"
+    if if_none_match:
+        etag = await cache.etag(key)
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag, cache_control)
     
-    total = jobs_query.count()
-    jobs = jobs_query.order_by(Job.posted_date.desc()).offset(skip).limit(limit).all()
+    body, etag, cache_status = await cache.get_or_compute(key, fetch)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, cache_control)
+    # Already serialized, so skip response_model validation
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"X-Cache": cache_status, "ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+@router.get("/facets", response_model=JobFacetsResponse)
+async def get_job_facets(
+    db: AsyncSession = Depends(get_read_db),
+    query: Optional[str] = None,
+    location: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+):
+    """
+    Job counts by platform, location, experience level and posting age,
+    for filter sidebars.
     
-    return JobListResponse(jobs=jobs, total=total)
+    Takes the same query/location filters as the job listing. Without
+    filters the counts come from pre-aggregated totals.
+    """
+    return await job_facets(db, query=query, location=location, limit=limit)
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-async def get_job(job_id: int, db: Session = Depends(get_db)):
+async def get_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    if_none_match: Optional[str] = Header(None),
+):
     """
     Get a specific job by ID.
+    
+    The ETag follows the job's updated_at; a matching If-None-Match gets
+    a 304 with no body.
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
+    row = (await db.execute(
+        select(*job_list_columns(), Job.updated_at).where(Job.id == job_id)
+    )).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found"
         )
-    return job
+    
+    job = row._asdict()
+    updated_at = job.pop("updated_at") or job["created_at"]
+    etag = make_etag("job", job_id, updated_at.isoformat() if updated_at else "")
+    cache_control = f"public, max-age={settings.JOB_DETAIL_MAX_AGE}"
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, cache_control)
+    
+    return Response(
+        content=orjson.dumps(job),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
 
 
 @router.post("/scrape", response_model=JobListResponse)
 async def scrape_jobs(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     query: Optional[str] = None,
     location: Optional[str] = None,
+    max_pages: Optional[int] = Query(None, ge=1, le=50),
+    max_results: Optional[int] = Query(None, ge=1, le=1000),
+    platforms: Optional[List[str]] = Query(None),
 ):
     """
     Trigger job scraping and store results in database.
     Aggregates jobs from multiple platforms.
+    
+    max_pages and max_results limit how much is fetched per platform.
     """
-    manager = ScraperManager()
-    scraped_jobs = await manager.scrape_all(query=query, location=location)
+    validate_platforms(platforms)
+    scraped_jobs = await scraper_manager.scrape_all(
+        query=query,
+        location=location,
+        max_pages=max_pages,
+        max_results=max_results,
+        platforms=platforms,
+    )
     
-    new_jobs_count = 0
-    created_jobs = []
+    created_jobs = await save_scraped_jobs(db, scraped_jobs)
     
-    for job_data in scraped_jobs:
-        # Check if job already exists (simplified check by title, company, and location)
-        existing = db.query(Job).filter(
-            Job.title == job_data.title,
-            Job.company == job_data.company,
-            Job.location == job_data.location
-        ).first()
-        
-        if not existing:
-            job = Job(**job_data.model_dump())
-            db.add(job)
-            created_jobs.append(job)
-            new_jobs_count += 1
+    return JobListResponse(jobs=created_jobs, total=len(created_jobs))
+
+
+@router.post("/scrape/stream")
+async def scrape_jobs_stream(
+    query: Optional[str] = None,
+    location: Optional[str] = None,
+    max_pages: Optional[int] = Query(None, ge=1, le=50),
+    max_results: Optional[int] = Query(None, ge=1, le=1000),
+    platforms: Optional[List[str]] = Query(None),
+):
+    """
+    Trigger job scraping and stream results as NDJSON.
+    
+    Each platform's new jobs are stored and emitted as soon as that
+    platform finishes, one line per batch:
+    {"platform": ..., "jobs": [...], "total": n}. A final
+    {"done": true, "total": n} line closes the stream.
+    """
+    validate_platforms(platforms)
     
-    db.commit()
+    async def stream():
+        total = 0
+        # The request-scoped session is closed before streaming starts
+        async with AsyncSessionLocal() as db:
+            async for platform, scraped_jobs in scraper_manager.iter_scrape_all(
+                query=query,
+                location=location,
+                max_pages=max_pages,
+                max_results=max_results,
+                platforms=platforms,
+            ):
+                created_jobs = await save_scraped_jobs(db, scraped_jobs)
+                total += len(created_jobs)
+                batch = {
+                    "platform": platform,
+                    "jobs": [
+                        JobResponse.model_validate(job).model_dump(mode="json")
+                        for job in created_jobs
+                    ],
+                    "total": len(created_jobs),
+                }
+                yield json.dumps(batch) + "\n"
+        yield json.dumps({"done": True, "total": total}) + "\n"
     
-    # Refresh to get IDs
-    for job in created_jobs:
-        db.refresh(job)
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.post("/scrape/tasks", response_model=ScrapeTaskResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_scrape_task(
+    query: Optional[str] = None,
+    location: Optional[str] = None,
+    max_pages: Optional[int] = Query(None, ge=1, le=50),
+    max_results: Optional[int] = Query(None, ge=1, le=1000),
+    platforms: Optional[List[str]] = Query(None),
+):
+    """
+    Queue a background scrape and return its task ID.
+    
+    An identical scrape that is already queued or running is reused
+    instead of starting a new one.
+    """
+    validate_platforms(platforms)
+    try:
+        task, created = scrape_task_queue.submit(
+            query=query,
+            location=location,
+            platforms=platforms,
+            max_pages=max_pages,
+            max_results=max_results,
+        )
+    except QueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Scrape queue is full, try again later"
+        )
+    
+    return task_response(task, deduplicated=not created)
+
+
+@router.get("/scrape/tasks/{task_id}", response_model=ScrapeTaskResponse)
+async def get_scrape_task(task_id: str):
+    """
+    Get the status of a background scrape.
+    """
+    task = scrape_task_queue.get(task_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+    return task_response(task)
+
+
+@router.get("/scrape/tasks/{task_id}/result", response_model=JobListResponse)
+async def get_scrape_task_result(task_id: str, db: AsyncSession = Depends(get_async_db)):
+    """
+    Get the new jobs stored by a finished background scrape.
+    """
+    task = scrape_task_queue.get(task_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+    if task.status == TaskStatus.FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Task failed: {task.error}"
+        )
+    if task.status != TaskStatus.SUCCEEDED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Task is {task.status.value}"
+        )
     
-    return JobListResponse(jobs=created_jobs, total=new_jobs_count)
+    jobs = []
+    if task.job_ids:
+        jobs = list(await db.scalars(select(Job).where(Job.id.in_(task.job_ids)).order_by(Job.id)))
+    return JobListResponse(jobs=jobs, total=len(jobs))
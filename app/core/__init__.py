@@ -1,6 +1,7 @@
 # Core module exports
 from app.core.config import settings
-from app.core.database import Base, get_db, init_db, engine
+from app.core.database import Base, get_db, get_async_db, init_db, engine, async_engine
+from app.core.hashing import password_hasher, HashingBusyError
 from app.core.security import (
     verify_password,
     get_password_hash,
@@ -13,10 +14,14 @@ __all__ = [
     "settings",
     "Base",
     "get_db",
+    "get_async_db",
     "init_db",
     "engine",
+    "async_engine",
     "verify_password",
     "get_password_hash",
+    "password_hasher",
+    "HashingBusyError",
     "create_access_token",
     "verify_token",
     "get_current_user",
@@ -1,9 +1,16 @@
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, TypeDecorator, create_engine, make_url
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
-from typing import Generator
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.schema import CreateColumn
+from typing import AsyncGenerator, Generator
+from datetime import timezone
 import logging
 
 from app.core.config import settings
+from app.core.db_pool import PoolStats, engine_options
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -11,11 +18,74 @@ logger = logging.getLogger(__name__)
 # Create base class for models
 Base = declarative_base()
 
-# Create engine
+
+@compiles(CreateColumn)
+def _skip_postgresql_only_columns(element, compiler, **kw):
+    """
+    Leave out columns marked info={"postgresql_only": True} (such as
+    generated tsvector columns) when creating tables on other dialects.
+    """
+    column = element.element
+    if column.info.get("postgresql_only") and compiler.dialect.name != "postgresql":
+        return None
+    return compiler.visit_create_column(element, **kw)
+
+class UTCDateTime(TypeDecorator):
+    """
+    Timezone-naive DateTime that stores aware datetimes as naive UTC.
+
+    psycopg2 silently dropped the offset of aware values bound to
+    TIMESTAMP columns; asyncpg rejects them, so convert up front.
+    """
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+
+# Dialect-specific INSERT constructs that support ON CONFLICT
+DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def conflict_insert(db: AsyncSession, table):
+    """INSERT for the session's dialect that supports on_conflict_do_nothing"""
+    return DIALECT_INSERTS[db.bind.dialect.name](table)
+
+
+# Async drivers for the sync drivers DATABASE_URL may name
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url: str) -> str:
+    """Swap a sync driver in a database URL for its async counterpart"""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername)
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+# Connection acquisition stats per engine, see pool_status()
+sync_pool_stats = PoolStats()
+async_pool_stats = PoolStats()
+
+# Create engine (migrations, scripts and init_db)
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
     echo=settings.DEBUG,
+    **engine_options(settings.DATABASE_URL, QueuePool, sync_pool_stats),
 )
 
 # Create session factory
@@ -26,6 +96,24 @@ SessionLocal = sessionmaker(
 )
 
 
+# Async engine used by the API endpoints and background tasks
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    echo=settings.DEBUG,
+    **engine_options(ASYNC_DATABASE_URL, AsyncAdaptedQueuePool, async_pool_stats),
+)
+
+# expire_on_commit=False so committed objects can still be serialized
+# without an implicit (and, under asyncio, impossible) lazy reload
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
 def get_db() -> Generator[Session, None, None]:
     """Dependency to get database session"""
     db = SessionLocal()
@@ -39,6 +127,25 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get an async database session"""
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Database session error: {e}")
+            await db.rollback()
+            raise
+
+
+def pool_status() -> dict:
+    """Live pool occupancy and acquisition stats for both engines"""
+    return {
+        "api": async_pool_stats.as_dict(async_engine.pool),
+        "sync": sync_pool_stats.as_dict(engine.pool),
+    }
+
+
 def init_db():
     """Initialize database tables"""
     try:
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from sqlalchemy import exc, make_url
+from sqlalchemy.pool import Pool
+import time
+
+from app.core.config import settings
+
+
+@dataclass
+class PoolStats:
+    """Connection acquisition counters for one engine's pool"""
+    checkouts: int = 0
+    timeouts: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    def as_dict(self, pool: Pool) -> dict:
+        status = {
+            "pool": type(pool).__name__,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "avg_acquire_ms": round(1000 * self.wait_time_total / self.checkouts, 3) if self.checkouts else 0.0,
+            "max_acquire_ms": round(1000 * self.wait_time_max, 3),
+        }
+        # QueuePool-style occupancy; absent on SQLite's in-memory pools
+        for name in ("size", "checkedout", "checkedin", "overflow"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                status[name] = method()
+        return status
+
+
+class _InstrumentedPoolMixin:
+    """Times each connection acquisition and counts pool timeouts"""
+    stats: PoolStats
+
+    def _do_get(self):
+        stats = self.stats
+        stats.waiting += 1
+        stats.max_waiting = max(stats.max_waiting, stats.waiting)
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            stats.timeouts += 1
+            raise
+        finally:
+            stats.waiting -= 1
+        elapsed = time.perf_counter() - start
+        stats.checkouts += 1
+        stats.wait_time_total += elapsed
+        stats.wait_time_max = max(stats.wait_time_max, elapsed)
+        return connection
+
+
+def instrumented_pool_class(base: type, stats: PoolStats) -> type:
+    """Subclass of a queue pool that records into stats (kept across pool.recreate())"""
+    return type(f"Instrumented{base.__name__}", (_InstrumentedPoolMixin, base), {"stats": stats})
+
+
+def engine_options(url: str, pool_class: type, stats: PoolStats) -> dict:
+    """
+    create_engine keyword arguments for the configured pool size,
+    overflow, recycle, acquire timeout and statement timeout.
+
+    In-memory SQLite keeps SQLAlchemy's default single-connection pool.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+
+    options = {
+        "poolclass": instrumented_pool_class(pool_class, stats),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
+    timeout_ms = settings.DB_STATEMENT_TIMEOUT_MS
+    if timeout_ms and parsed.get_backend_name() == "postgresql":
+        if parsed.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(timeout_ms)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout_ms}"}
+    return options
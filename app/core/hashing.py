@@ -0,0 +1,116 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+import asyncio
+import logging
+import threading
+import time
+
+from app.core.config import settings
+from app.core.security import pwd_context
+
+logger = logging.getLogger(__name__)
+
+
+class HashingBusyError(Exception):
+    """Too many password hashes are already running or queued"""
+
+
+class PasswordHashPool:
+    """
+    Bounded executor for bcrypt.
+
+    Each hash or verify burns BCRYPT_ROUNDS worth of CPU, hundreds of
+    milliseconds at the default cost. bcrypt releases the GIL, so a few
+    worker threads keep that off the event loop and the rest of the API
+    responsive. At most max_pending operations may be running or queued;
+    beyond that calls fail at once with HashingBusyError (a 503) instead
+    of queueing for seconds while holding a database connection.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Guards the counters, which worker threads update on completion
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self.wait_seconds = 0.0
+        self.hash_seconds = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HashingBusyError(f"{self.pending} password hashes pending")
+            self.pending += 1
+
+        submitted = time.perf_counter()
+        started = submitted
+
+        def timed():
+            nonlocal started
+            started = time.perf_counter()
+            return func(*args)
+
+        def done(_: Future):
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+                self.wait_seconds += started - submitted
+                self.hash_seconds += time.perf_counter() - started
+
+        try:
+            future = self._get_executor().submit(timed)
+        except BaseException:
+            with self._lock:
+                self.pending -= 1
+            raise
+        # Released when the hash finishes, not when the caller stops waiting:
+        # a cancelled request (client gone) leaves the hash running
+        future.add_done_callback(done)
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        return await self.run(pwd_context.hash, password)
+
+    async def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check a password; on success also return a new hash when the
+        stored one uses another cost than BCRYPT_ROUNDS, else None.
+        """
+        valid, new_hash = await self.run(pwd_context.verify_and_update, password, hashed)
+        if new_hash is not None:
+            self.rehashed += 1
+        return valid, new_hash
+
+    def shutdown(self):
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def status(self) -> dict:
+        return {
+            "rounds": settings.BCRYPT_ROUNDS,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+            "avg_wait_ms": round(self.wait_seconds / self.completed * 1000, 1) if self.completed else 0.0,
+            "avg_hash_ms": round(self.hash_seconds / self.completed * 1000, 1) if self.completed else 0.0,
+        }
+
+
+password_hasher = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
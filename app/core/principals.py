@@ -0,0 +1,106 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+import time
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.security import get_current_user
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user, without credentials"""
+    id: int
+    email: str
+    name: str
+    is_active: bool
+    created_at: Optional[datetime]
+
+
+class UserCache:
+    """
+    Short-lived LRU cache of user rows for authenticated requests.
+
+    Rows are read from the primary and kept for `ttl` seconds, so auth on
+    the hot path is a dictionary lookup. Call invalidate() after changing
+    a user (deactivating them, say) to drop the entry at once. The cache
+    is per process; other workers see the change within `ttl`.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[Optional[Principal], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def load(self, user_id: int) -> Optional[Principal]:
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(
+                select(User.id, User.email, User.name, User.is_active, User.created_at)
+                .where(User.id == user_id)
+            )).first()
+        if row is None:
+            return None
+        # is_active is nullable; only an explicit False disables
+        return Principal(**{**row._asdict(), "is_active": row.is_active is not False})
+
+    async def get(self, user_id: int) -> Optional[Principal]:
+        """The user, or None if there is no such user"""
+        entry = self._entries.get(user_id)
+        now = time.monotonic()
+        if entry is not None and entry[1] > now:
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        principal = await self.load(user_id)
+        if self.ttl > 0 and self.max_entries > 0:
+            self._entries[user_id] = (principal, now + self.ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, user_id: int):
+        self._entries.pop(user_id, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "ttl": self.ttl,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+user_cache = UserCache(ttl=settings.USER_CACHE_TTL, max_entries=settings.USER_CACHE_MAX_ENTRIES)
+
+
+async def get_current_principal(current_user: dict = Depends(get_current_user)) -> Principal:
+    """Dependency for the authenticated user; rejects deleted and disabled accounts"""
+    principal = await user_cache.get(int(current_user["user_id"]))
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User account is disabled"
+        )
+    return principal
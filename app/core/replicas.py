@@ -0,0 +1,181 @@
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, Dict, List, Optional
+import asyncio
+import itertools
+import logging
+import time
+
+from fastapi import Depends
+from sqlalchemy import make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, async_database_url
+from app.core.db_pool import PoolStats, engine_options
+from app.core.principals import Principal, get_current_principal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Replica:
+    name: str
+    engine: AsyncEngine
+    sessionmaker: async_sessionmaker
+    pool_stats: PoolStats
+    healthy: bool = True
+    last_error: Optional[str] = None
+    sessions: int = 0
+
+    def status(self) -> dict:
+        return {
+            "healthy": self.healthy,
+            "last_error": self.last_error,
+            "sessions": self.sessions,
+            "pool": self.pool_stats.as_dict(self.engine.pool),
+        }
+
+
+@dataclass
+class ReplicaRouter:
+    """
+    Route read-only sessions to read replicas.
+
+    Replicas are used round robin, skipping any that failed their last
+    health check; with no healthy replica (or none configured) reads go
+    to the primary. A user who just wrote is pinned to the primary for
+    REPLICA_STICKY_SECONDS so they read their own writes despite
+    replication lag. The pin is per process.
+    """
+    urls: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.replicas: List[Replica] = []
+        for number, url in enumerate(self.urls):
+            url = async_database_url(url)
+            stats = PoolStats()
+            engine = create_async_engine(
+                url,
+                pool_pre_ping=True,
+                echo=settings.DEBUG,
+                **engine_options(url, AsyncAdaptedQueuePool, stats),
+            )
+            self.replicas.append(Replica(
+                name=f"replica-{number}",
+                engine=engine,
+                sessionmaker=async_sessionmaker(engine, expire_on_commit=False, autoflush=False),
+                pool_stats=stats,
+            ))
+            logger.info(f"Read replica replica-{number}: {make_url(url).render_as_string()}")
+        self._next = itertools.count()
+        self._recent_writers: Dict[int, float] = {}
+        self._health_task: Optional[asyncio.Task] = None
+        self.primary_reads = 0
+
+    def start(self):
+        """Start the background health checks"""
+        if self.replicas and self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def aclose(self):
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def check(self, replica: Replica):
+        try:
+            async with replica.engine.connect() as conn:
+                await asyncio.wait_for(
+                    conn.execute(text("SELECT 1")),
+                    timeout=settings.REPLICA_HEALTH_CHECK_TIMEOUT,
+                )
+        except Exception as e:
+            if replica.healthy:
+                logger.warning(f"{replica.name} failed its health check: {e!r}")
+            replica.healthy = False
+            replica.last_error = repr(e)
+        else:
+            if not replica.healthy:
+                logger.info(f"{replica.name} is healthy again")
+            replica.healthy = True
+            replica.last_error = None
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+            self._prune_writers()
+            await asyncio.sleep(settings.REPLICA_HEALTH_CHECK_INTERVAL)
+
+    def note_write(self, user_id: int):
+        """Pin a user's reads to the primary after they write"""
+        self._recent_writers[user_id] = time.monotonic() + settings.REPLICA_STICKY_SECONDS
+
+    def is_pinned(self, user_id: int) -> bool:
+        until = self._recent_writers.get(user_id)
+        return until is not None and until > time.monotonic()
+
+    def _prune_writers(self):
+        now = time.monotonic()
+        for user_id in [u for u, until in self._recent_writers.items() if until <= now]:
+            del self._recent_writers[user_id]
+
+    def pick(self) -> Optional[Replica]:
+        """Next healthy replica, or None to read from the primary"""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._next) % len(self.replicas)]
+            if replica.healthy:
+                return replica
+        return None
+
+    def session(self, user_id: Optional[int] = None) -> AsyncSession:
+        """Session for read-only work, on a replica when possible"""
+        replica = None if user_id is not None and self.is_pinned(user_id) else self.pick()
+        if replica is None:
+            self.primary_reads += 1
+            return AsyncSessionLocal()
+        replica.sessions += 1
+        return replica.sessionmaker()
+
+    def status(self) -> dict:
+        return {
+            "replicas": {replica.name: replica.status() for replica in self.replicas},
+            "primary_reads": self.primary_reads,
+            "pinned_users": sum(self.is_pinned(u) for u in list(self._recent_writers)),
+        }
+
+
+replica_router = ReplicaRouter(settings.DATABASE_REPLICA_URLS)
+
+
+@asynccontextmanager
+async def _read_session(db: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
+    async with db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Database session error: {e}")
+            await db.rollback()
+            raise
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for read-only endpoints; may lag the primary slightly"""
+    # A context manager, so errors raised by the endpoint reach _read_session
+    async with _read_session(replica_router.session()) as db:
+        yield db
+
+
+async def get_user_read_db(
+    principal: Principal = Depends(get_current_principal),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Read-only session for a user's own data, with read-your-writes"""
+    async with _read_session(replica_router.session(principal.id)) as db:
+        yield db
@@ -1,12 +1,22 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from sqlalchemy import exc as sa_exc
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 import logging
 
 from app.core.config import settings
-from app.core.database import init_db, engine, Base
+from app.core.database import async_engine, Base, pool_status
+from app.core.hashing import password_hasher, HashingBusyError
+from app.core.principals import user_cache
+from app.core.security import token_cache
+from app.core.replicas import replica_router
 from app.api.v1.api import api_router
+from app.services.scraping import scraper_manager
+from app.services.tasks import scrape_task_queue
+from app.services.archive import job_archiver
+from app.services.query_cache import job_list_cache
 
 # Configure logging
 logging.basicConfig(level=settings.LOG_LEVEL)
@@ -21,15 +31,35 @@ async def lifespan(app: FastAPI):
     # Initialize database tables
     try:
         # Import all models to ensure they're registered with Base
-        from app.models import User, Job, AppliedJob
-        Base.metadata.create_all(bind=engine)
+        from app.models import User, Job, AppliedJob, JobArchive, JobFacetCount
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables initialized")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
     
+    # Health-check read replicas, if configured
+    replica_router.start()
+    
+    # Open the shared scraper HTTP client pool
+    await scraper_manager.start()
+    
+    # Start background scrape workers
+    scrape_task_queue.start()
+    
+    # Move expired jobs out of the hot table
+    job_archiver.start()
+    
     yield
     
     logger.info("Shutting down application")
+    await job_archiver.aclose()
+    await scrape_task_queue.aclose()
+    await scraper_manager.aclose()
+    await replica_router.aclose()
+    await job_list_cache.aclose()
+    password_hasher.shutdown()
+    await async_engine.dispose()
 
 
 # Create FastAPI application
@@ -53,6 +83,28 @@ app.add_middleware(
 
 
 # Exception handlers
+@app.exception_handler(sa_exc.TimeoutError)
+async def db_pool_timeout_handler(request: Request, exc: sa_exc.TimeoutError):
+    """No database connection freed up within DB_POOL_TIMEOUT"""
+    logger.warning(f"Database pool exhausted: {exc}")
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database busy, try again later"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(HashingBusyError)
+async def hashing_busy_handler(request: Request, exc: HashingBusyError):
+    """Password hashing queue is full"""
+    logger.warning(f"Password hashing saturated: {exc}")
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many sign-ins right now, try again shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
@@ -74,6 +126,52 @@ async def health_check():
     }
 
 
+@app.get("/health/scrapers", tags=["Health"])
+async def scraper_health():
+    """Per-platform scraper rate limit and HTTP cache state"""
+    return {
+        "rate_limits": scraper_manager.rate_limits(),
+        "http_cache": scraper_manager.http_cache_info(),
+        "result_cache": scraper_manager.result_cache_info(),
+    }
+
+
+@app.get("/health/auth", tags=["Health"])
+async def auth_health():
+    """Password hashing queue and token/user cache hit ratios"""
+    return {
+        "password_hashing": password_hasher.status(),
+        "token_cache": token_cache.stats(),
+        "user_cache": user_cache.stats(),
+    }
+
+
+@app.get("/health/cache", tags=["Health"])
+async def cache_health():
+    """Job listing result cache hit ratio and latency saved"""
+    return {"job_list": job_list_cache.info()}
+
+
+@app.get("/health/db", tags=["Health"])
+async def database_health():
+    """Database connection pool occupancy and acquire latency"""
+    return {
+        "pools": pool_status(),
+        "read_routing": replica_router.status(),
+        "archive": {
+            "retention_days": settings.JOB_RETENTION_DAYS,
+            "last_run": asdict(job_archiver.last_run) if job_archiver.last_run else None,
+        },
+        "config": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "statement_timeout_ms": settings.DB_STATEMENT_TIMEOUT_MS,
+        },
+    }
+
+
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
@@ -2,5 +2,7 @@
 from app.models.user import User
 from app.models.job import Job
 from app.models.applied_job import AppliedJob
+from app.models.job_archive import JobArchive
+from app.models.job_facet import JobFacetCount
 
-__all__ = ["User", "Job", "AppliedJob"]
+__all__ = ["User", "Job", "AppliedJob", "JobArchive", "JobFacetCount"]
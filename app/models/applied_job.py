@@ -1,17 +1,28 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 
-from app.core.database import Base
+from app.core.database import Base, UTCDateTime
 
 
 class AppliedJob(Base):
     __tablename__ = "applied_jobs"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    # Looked up through the (user_id, ...) composite indexes below
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
-    applied_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    applied_at = Column(UTCDateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "job_id", name="uq_applied_jobs_user_job"),
+        # A user's applications, newest first, in keyset page order;
+        # covers the listing on Postgres
+        Index(
+            "ix_applied_jobs_user_applied_at", user_id, applied_at.desc(), id.desc(),
+            postgresql_include=["job_id"],
+        ),
+    )
 
     # Relationships
     user = relationship("User", back_populates="applied_jobs")
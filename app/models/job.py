@@ -1,12 +1,52 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Computed, Index, DDL, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime, timezone
+from typing import Optional
+import hashlib
 
-from app.core.database import Base
+from app.core.database import Base, UTCDateTime
+
+
+def job_dedup_key(title: Optional[str], company: Optional[str], location: Optional[str]) -> str:
+    """Content hash identifying the same posting across scrapes"""
+    normalized = "|".join((value or "").strip().lower() for value in (title, company, location))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _default_dedup_key(context) -> str:
+    params = context.get_current_parameters()
+    return job_dedup_key(params.get("title"), params.get("company"), params.get("location"))
+
+
+# Weighted document for full-text search: title > company > description
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
 
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        Index(
+            "ix_jobs_title_trgm", "title",
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_jobs_company_trgm", "company",
+            postgresql_using="gin", postgresql_ops={"company": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_jobs_location_trgm", "location",
+            postgresql_using="gin", postgresql_ops={"location": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+    # Don't RETURNING server-generated columns on insert; search_vector
+    # doesn't exist outside Postgres and is never read back anyway
+    __mapper_args__ = {"eager_defaults": False}
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False, index=True)
@@ -15,15 +55,40 @@ class Job(Base):
     platform = Column(String(100))  # e.g., LinkedIn, Indeed, Mock
     description = Column(Text)
     apply_url = Column(String(500))
-    posted_date = Column(DateTime)
+    posted_date = Column(UTCDateTime)
     experience_level = Column(String(50))  # e.g., Entry, Mid, Senior
     salary_range = Column(String(100))  # e.g., "$80k-$100k"
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    dedup_key = Column(String(64), unique=True, index=True, nullable=False, default=_default_dedup_key)
+    # Maintained by Postgres; deferred so it is never loaded with the row
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_SQL, persisted=True),
+        info={"postgresql_only": True},
+    ))
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
-        DateTime,
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc)
     )
 
     # Relationships
     applied_jobs = relationship("AppliedJob", back_populates="job")
+
+
+# Keyset pagination order for job listings (newest first). SQLite can't
+# declare NULLS LAST on an index but already sorts NULLs last on DESC.
+Index(
+    "ix_jobs_posted_date_id", Job.posted_date.desc().nulls_last(), Job.id.desc(),
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_jobs_posted_date_id", Job.posted_date.desc(), Job.id.desc(),
+).ddl_if(callable_=lambda ddl, target, bind, **kw: kw["dialect"].name != "postgresql")
+
+
+# Trigram indexes need pg_trgm before the table is created
+event.listen(
+    Job.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, Text, PrimaryKeyConstraint
+from datetime import datetime, timezone
+
+from app.core.database import Base, UTCDateTime
+
+
+class JobArchive(Base):
+    """
+    Jobs moved out of the hot jobs table by the retention task.
+
+    On Postgres the table is range-partitioned by month of created_at;
+    partitions are created on demand and old ones can be dropped whole.
+    Jobs referenced by applied_jobs are never archived.
+    """
+    __tablename__ = "jobs_archive"
+    __table_args__ = (
+        # Partitioned tables need the partition key in the primary key
+        PrimaryKeyConstraint("id", "created_at", name="pk_jobs_archive"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    id = Column(Integer, nullable=False, autoincrement=False)
+    title = Column(String(255), nullable=False)
+    company = Column(String(255), nullable=False)
+    location = Column(String(255))
+    platform = Column(String(100))
+    description = Column(Text)
+    apply_url = Column(String(500))
+    posted_date = Column(UTCDateTime)
+    experience_level = Column(String(50))
+    salary_range = Column(String(100))
+    dedup_key = Column(String(64), nullable=False, index=True)
+    created_at = Column(UTCDateTime, nullable=False)
+    updated_at = Column(UTCDateTime)
+    archived_at = Column(UTCDateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
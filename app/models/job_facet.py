@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, PrimaryKeyConstraint
+
+from app.core.database import Base
+
+
+class JobFacetCount(Base):
+    """
+    Pre-aggregated job counts per facet value for GET /jobs/facets.
+
+    Maintained incrementally as jobs are ingested and archived; missing
+    values (e.g. no platform) are stored as "".
+    """
+    __tablename__ = "job_facet_counts"
+    __table_args__ = (
+        PrimaryKeyConstraint("facet", "value", name="pk_job_facet_counts"),
+    )
+
+    facet = Column(String(32), nullable=False)  # platform, location, experience_level, posted_day
+    value = Column(String(255), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
@@ -13,13 +13,19 @@ from app.schemas.job import (
     JobCreate,
     JobResponse,
     JobListResponse,
+    FacetCount,
+    JobFacetsResponse,
 )
 from app.schemas.applied_job import (
     AppliedJobBase,
     AppliedJobCreate,
     AppliedJobResponse,
     AppliedJobListResponse,
+    AppliedJobBatchCreate,
+    AppliedJobBatchResult,
+    AppliedJobBatchResponse,
 )
+from app.schemas.task import ScrapeTaskResponse
 
 __all__ = [
     "UserBase",
@@ -33,8 +39,14 @@ __all__ = [
     "JobCreate",
     "JobResponse",
     "JobListResponse",
+    "FacetCount",
+    "JobFacetsResponse",
     "AppliedJobBase",
     "AppliedJobCreate",
     "AppliedJobResponse",
     "AppliedJobListResponse",
+    "AppliedJobBatchCreate",
+    "AppliedJobBatchResult",
+    "AppliedJobBatchResponse",
+    "ScrapeTaskResponse",
 ]
@@ -1,7 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
 from datetime import datetime
 from app.schemas.job import JobResponse
 
+# Most job ids one batch apply request may carry
+MAX_BATCH_APPLY = 100
+
 
 class AppliedJobBase(BaseModel):
     job_id: int
@@ -11,11 +15,16 @@ class AppliedJobCreate(AppliedJobBase):
     pass
 
 
+class AppliedJobBatchCreate(BaseModel):
+    job_ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_APPLY)
+
+
 class AppliedJobResponse(BaseModel):
     id: int
     job_id: int
     applied_at: datetime
-    job: JobResponse
+    # None when listed with job=none
+    job: Optional[JobResponse] = None
 
     class Config:
         from_attributes = True
@@ -24,3 +33,17 @@ class AppliedJobResponse(BaseModel):
 class AppliedJobListResponse(BaseModel):
     applied_jobs: list[AppliedJobResponse]
     total: int
+    next_cursor: Optional[str] = None
+
+
+class AppliedJobBatchResult(BaseModel):
+    job_id: int
+    status: Literal["applied", "already_applied", "not_found"]
+    # Set for new applications
+    id: Optional[int] = None
+    applied_at: Optional[datetime] = None
+
+
+class AppliedJobBatchResponse(BaseModel):
+    results: list[AppliedJobBatchResult]
+    applied: int
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Literal, Optional
 from datetime import datetime
 
 
@@ -29,4 +29,21 @@ class JobResponse(JobBase):
 
 class JobListResponse(BaseModel):
     jobs: list[JobResponse]
+    total: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
+
+
+class FacetCount(BaseModel):
+    value: Optional[str] = None
+    count: int
+
+
+class JobFacetsResponse(BaseModel):
     total: int
+    platform: list[FacetCount]
+    location: list[FacetCount]
+    experience_level: list[FacetCount]
+    posted_age: list[FacetCount]
+    # aggregate: served from pre-aggregated counts; live: GROUP BY over matches
+    source: Literal["aggregate", "live"]
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class ScrapeTaskResponse(BaseModel):
+    task_id: str
+    status: str
+    query: Optional[str] = None
+    location: Optional[str] = None
+    platforms: Optional[list[str]] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    new_jobs: int = 0
+    error: Optional[str] = None
+    deduplicated: bool = False
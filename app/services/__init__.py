@@ -1,4 +1,5 @@
 # Services module exports
 from app.services.scraping import BaseJobScraper, MockJobScraper
+from app.services.ingest import save_scraped_jobs
 
-__all__ = ["BaseJobScraper", "MockJobScraper"]
+__all__ = ["BaseJobScraper", "MockJobScraper", "save_scraped_jobs"]
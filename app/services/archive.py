@@ -0,0 +1,221 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+import asyncio
+import logging
+import re
+
+from sqlalchemy import delete, exists, func, insert, literal, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, UTCDateTime
+from app.models.applied_job import AppliedJob
+from app.models.job import Job
+from app.models.job_archive import JobArchive
+from app.services.facets import apply_facet_deltas, facet_deltas
+from app.services.query_cache import job_list_cache
+
+logger = logging.getLogger(__name__)
+
+# Columns copied from jobs into jobs_archive
+ARCHIVED_COLUMNS = [
+    "id", "title", "company", "location", "platform", "description", "apply_url",
+    "posted_date", "experience_level", "salary_range", "dedup_key", "created_at", "updated_at",
+]
+
+PARTITION_NAME = re.compile(r"^jobs_archive_(\d{4})_(\d{2})$")
+
+# pg_try_advisory_xact_lock key so only one worker process archives at a time
+ARCHIVE_LOCK_ID = 0x6A6F6273
+
+
+def partition_name(month: datetime) -> str:
+    return f"jobs_archive_{month:%Y_%m}"
+
+
+def _next_month(month: datetime) -> datetime:
+    return (month.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def archivable(cutoff: datetime):
+    """Jobs older than cutoff that no application references"""
+    return (
+        func.coalesce(Job.posted_date, Job.created_at) < cutoff,
+        ~exists().where(AppliedJob.job_id == Job.id),
+    )
+
+
+def partition_key(now: datetime):
+    """
+    The jobs_archive created_at (partition key) a job is archived with.
+    Used both to pick partitions and to insert, so rows always land in
+    the partition made for them.
+    """
+    # The partition key can't be NULL
+    return func.coalesce(Job.created_at, Job.posted_date, literal(now, UTCDateTime()))
+
+
+async def _partition_names(db: AsyncSession) -> List[str]:
+    return list(await db.scalars(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = 'jobs_archive'"
+    )))
+
+
+async def ensure_partitions(db: AsyncSession, ids: List[int], now: datetime):
+    """Create the monthly jobs_archive partitions a batch of jobs will go into"""
+    months = await db.scalars(
+        select(func.date_trunc("month", partition_key(now))).where(Job.id.in_(ids)).distinct()
+    )
+    existing = set(await _partition_names(db))
+    await db.execute(text("CREATE TABLE IF NOT EXISTS jobs_archive_default PARTITION OF jobs_archive DEFAULT"))
+    for month in months:
+        name = partition_name(month)
+        if name in existing:
+            continue
+        bounds = {"start": month, "end": _next_month(month)}
+        # Postgres refuses a partition whose rows already sit in DEFAULT;
+        # leave such a month in DEFAULT rather than fail every batch
+        stranded = await db.scalar(text(
+            "SELECT EXISTS (SELECT 1 FROM jobs_archive_default "
+            "WHERE created_at >= :start AND created_at < :end)"
+        ), bounds)
+        if stranded:
+            logger.warning(f"jobs_archive_default holds rows for {month:%Y-%m}; not creating {name}")
+            continue
+        await db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF jobs_archive "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{_next_month(month):%Y-%m-%d}')"
+        ))
+
+
+async def drop_old_partitions(db: AsyncSession, older_than: datetime) -> List[str]:
+    """Detach and drop archive partitions whose month ended before older_than"""
+    dropped = []
+    for name in await _partition_names(db):
+        match = PARTITION_NAME.match(name)
+        if not match:
+            continue
+        month = datetime(int(match.group(1)), int(match.group(2)), 1)
+        if _next_month(month) <= older_than:
+            await db.execute(text(f"ALTER TABLE jobs_archive DETACH PARTITION {name}"))
+            await db.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    return dropped
+
+
+async def archive_jobs(db: AsyncSession, cutoff: datetime, batch_size: int) -> int:
+    """
+    Move one batch of expired jobs into jobs_archive.
+    Returns the number of jobs moved; the caller commits.
+    """
+    rows = (await db.execute(
+        select(Job.id, Job.platform, Job.location, Job.experience_level, Job.posted_date)
+        .where(*archivable(cutoff))
+        .order_by(Job.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )).all()
+    if not rows:
+        return 0
+    ids = [row.id for row in rows]
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    if db.bind.dialect.name == "postgresql":
+        await ensure_partitions(db, ids, now)
+    values = [
+        partition_key(now) if name == "created_at" else getattr(Job, name)
+        for name in ARCHIVED_COLUMNS
+    ]
+    await db.execute(
+        insert(JobArchive).from_select(
+            ARCHIVED_COLUMNS + ["archived_at"],
+            select(*values, literal(now, UTCDateTime())).where(Job.id.in_(ids)),
+        )
+    )
+    await db.execute(delete(Job).where(Job.id.in_(ids)))
+    await apply_facet_deltas(db, facet_deltas(rows, sign=-1))
+    return len(ids)
+
+
+@dataclass
+class ArchiveRun:
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    archived: int = 0
+    dropped_partitions: Optional[List[str]] = None
+    skipped: bool = False
+    error: Optional[str] = None
+
+
+class JobArchiver:
+    """
+    Background retention task for the jobs table.
+
+    Every JOB_ARCHIVE_INTERVAL seconds, jobs older than JOB_RETENTION_DAYS
+    that nobody applied to are moved to jobs_archive in batches, keeping
+    the hot table and its indexes small. On Postgres an advisory lock
+    keeps concurrent worker processes from archiving at the same time,
+    and archive partitions past JOB_ARCHIVE_DROP_AFTER_DAYS are dropped.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.last_run: Optional[ArchiveRun] = None
+
+    def start(self):
+        if self._task is None and settings.JOB_RETENTION_DAYS > 0:
+            self._task = asyncio.create_task(self._loop(), name="job-archiver")
+
+    async def aclose(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run_once(self) -> ArchiveRun:
+        run = ArchiveRun(started_at=datetime.now(timezone.utc))
+        cutoff = run.started_at - timedelta(days=settings.JOB_RETENTION_DAYS)
+        try:
+            async with AsyncSessionLocal() as db:
+                postgres = db.bind.dialect.name == "postgresql"
+                while True:
+                    if postgres:
+                        locked = await db.scalar(text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": ARCHIVE_LOCK_ID})
+                        if not locked:
+                            run.skipped = True
+                            break
+                    moved = await archive_jobs(db, cutoff, settings.JOB_ARCHIVE_BATCH_SIZE)
+                    await db.commit()
+                    run.archived += moved
+                    if moved < settings.JOB_ARCHIVE_BATCH_SIZE:
+                        break
+
+                if postgres and not run.skipped and settings.JOB_ARCHIVE_DROP_AFTER_DAYS > 0:
+                    older_than = run.started_at - timedelta(days=settings.JOB_ARCHIVE_DROP_AFTER_DAYS)
+                    run.dropped_partitions = await drop_old_partitions(db, older_than.replace(tzinfo=None))
+                    await db.commit()
+        except Exception as e:
+            logger.error(f"Job archival failed: {e}")
+            run.error = str(e)
+        if run.archived:
+            await job_list_cache.invalidate()
+        run.finished_at = datetime.now(timezone.utc)
+        self.last_run = run
+        if run.archived or run.dropped_partitions:
+            logger.info(
+                f"Archived {run.archived} jobs older than {cutoff:%Y-%m-%d}"
+                + (f", dropped {', '.join(run.dropped_partitions)}" if run.dropped_partitions else "")
+            )
+        return run
+
+    async def _loop(self):
+        while True:
+            await self.run_once()
+            await asyncio.sleep(settings.JOB_ARCHIVE_INTERVAL)
+
+
+job_archiver = JobArchiver()
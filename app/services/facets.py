@@ -0,0 +1,170 @@
+from collections import Counter
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import conflict_insert
+from app.models.job import Job
+from app.models.job_facet import JobFacetCount
+from app.services.job_search import apply_job_filters
+
+# Facets counted by value, in response order
+FACETS = ("platform", "location", "experience_level")
+# Per-day posting counts; rolled up into the posted_age buckets at read time
+POSTED_DAY = "posted_day"
+POSTED_AGE_BUCKETS = (("past_day", 1), ("past_week", 7), ("past_month", 30))
+# Sums to the number of jobs
+TOTAL = "total"
+
+FacetKey = Tuple[str, str]
+
+
+def facet_keys(job) -> List[FacetKey]:
+    """(facet, value) pairs a job is counted under"""
+    keys = [(facet, getattr(job, facet) or "") for facet in FACETS]
+    keys.append((POSTED_DAY, job.posted_date.date().isoformat() if job.posted_date else ""))
+    keys.append((TOTAL, ""))
+    return keys
+
+
+def facet_deltas(jobs: Iterable, sign: int = 1) -> Counter:
+    """Count changes for adding (sign=1) or removing (sign=-1) jobs"""
+    deltas: Counter = Counter()
+    for job in jobs:
+        for key in facet_keys(job):
+            deltas[key] += sign
+    return deltas
+
+
+async def apply_facet_deltas(db: AsyncSession, deltas: Counter):
+    """
+    Add deltas to the stored counts in one upsert; the caller commits.
+    Keys are written in sorted order so concurrent ingests don't deadlock.
+    """
+    rows = [
+        {"facet": facet, "value": value[:255], "count": delta}
+        for (facet, value), delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return
+    stmt = conflict_insert(db, JobFacetCount).values(rows)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[JobFacetCount.facet, JobFacetCount.value],
+        set_={"count": JobFacetCount.count + stmt.excluded["count"]},
+    ))
+    if any(row["count"] < 0 for row in rows):
+        await db.execute(delete(JobFacetCount).where(JobFacetCount.count <= 0))
+
+
+async def rebuild_facet_counts(db: AsyncSession):
+    """Recompute every stored count from the jobs table; the caller commits"""
+    deltas: Counter = Counter()
+    for facet in FACETS:
+        column = getattr(Job, facet)
+        rows = await db.execute(select(column, func.count()).group_by(column))
+        for value, count in rows:
+            deltas[(facet, value or "")] += count
+    posted_day = func.date(Job.posted_date)
+    for day, count in await db.execute(select(posted_day, func.count()).group_by(posted_day)):
+        # date on Postgres, 'YYYY-MM-DD' text on SQLite
+        deltas[(POSTED_DAY, str(day) if day else "")] += count
+    deltas[(TOTAL, "")] = await db.scalar(select(func.count(Job.id)))
+
+    await db.execute(delete(JobFacetCount))
+    await apply_facet_deltas(db, deltas)
+
+
+def _facet_list(counts: Iterable[Tuple[str, int]]) -> List[dict]:
+    return [{"value": value or None, "count": count} for value, count in counts]
+
+
+def _age_cutoffs() -> List[Tuple[str, date]]:
+    """Oldest posting day per age bucket; counts have day granularity"""
+    today = datetime.now(timezone.utc).date()
+    return [(name, today - timedelta(days=days)) for name, days in POSTED_AGE_BUCKETS]
+
+
+async def _aggregate_facets(db: AsyncSession, limit: int) -> Dict:
+    result = {}
+    for facet in FACETS:
+        rows = await db.execute(
+            select(JobFacetCount.value, JobFacetCount.count)
+            .where(JobFacetCount.facet == facet)
+            .order_by(JobFacetCount.count.desc(), JobFacetCount.value)
+            .limit(limit)
+        )
+        result[facet] = _facet_list(rows)
+
+    cutoffs = _age_cutoffs()
+    days = dict((await db.execute(
+        select(JobFacetCount.value, JobFacetCount.count).where(
+            JobFacetCount.facet == POSTED_DAY,
+            JobFacetCount.value != "",
+            JobFacetCount.value >= min(cutoff for _, cutoff in cutoffs).isoformat(),
+        )
+    )).all())
+    result["posted_age"] = [
+        {"value": name, "count": sum(count for day, count in days.items() if day >= cutoff.isoformat())}
+        for name, cutoff in cutoffs
+    ]
+    result["total"] = await db.scalar(
+        select(JobFacetCount.count).where(JobFacetCount.facet == TOTAL)
+    ) or 0
+    result["source"] = "aggregate"
+    return result
+
+
+async def _live_facets(db: AsyncSession, query: Optional[str], location: Optional[str], limit: int) -> Dict:
+    dialect_name = db.bind.dialect.name
+
+    def filtered(stmt):
+        return apply_job_filters(stmt, dialect_name, query=query, location=location)
+
+    result = {}
+    for facet in FACETS:
+        column = getattr(Job, facet)
+        count = func.count(Job.id)
+        rows = await db.execute(
+            filtered(select(column, count))
+            .group_by(column)
+            .order_by(count.desc(), column)
+            .limit(limit)
+        )
+        result[facet] = _facet_list(rows)
+
+    cutoffs = _age_cutoffs()
+    row = (await db.execute(filtered(select(
+        func.count(Job.id),
+        *(
+            func.sum(case((Job.posted_date >= datetime.combine(cutoff, time.min), 1), else_=0))
+            for _, cutoff in cutoffs
+        ),
+    )))).one()
+    result["total"] = row[0]
+    result["posted_age"] = [
+        {"value": name, "count": count or 0}
+        for (name, _), count in zip(cutoffs, row[1:])
+    ]
+    result["source"] = "live"
+    return result
+
+
+async def job_facets(
+    db: AsyncSession,
+    query: Optional[str] = None,
+    location: Optional[str] = None,
+    limit: int = 20,
+) -> Dict:
+    """
+    Facet counts for the job listing sidebar.
+
+    Unfiltered requests read the pre-aggregated job_facet_counts table.
+    With query/location filters the counts are computed live over the
+    matching jobs, which the search indexes keep to a small set.
+    """
+    if query or location:
+        return await _live_facets(db, query, location, limit)
+    return await _aggregate_facets(db, limit)
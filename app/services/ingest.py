@@ -0,0 +1,58 @@
+from typing import Dict, List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import conflict_insert
+from app.models.job import Job, job_dedup_key
+from app.models.job_archive import JobArchive
+from app.schemas.job import JobCreate
+from app.services.facets import apply_facet_deltas, facet_deltas
+from app.services.query_cache import job_list_cache
+
+async def save_scraped_jobs(db: AsyncSession, scraped_jobs: List[JobCreate]) -> List[Job]:
+    """
+    Store scraped jobs that are not already in the database.
+    Returns the newly created jobs with their IDs populated.
+
+    Jobs are deduplicated on their content hash (dedup_key) and inserted
+    in batches with INSERT ... ON CONFLICT DO NOTHING RETURNING, so
+    concurrent scrapes of the same postings are safe. Postings that were
+    archived (see JOB_RETENTION_DAYS) are skipped too, so a long-running
+    listing isn't stored again as a new job.
+    """
+    # Deduplicate within the batch, keeping the first occurrence
+    rows: Dict[str, dict] = {}
+    for job_data in scraped_jobs:
+        key = job_dedup_key(job_data.title, job_data.company, job_data.location)
+        if key not in rows:
+            rows[key] = {**job_data.model_dump(), "dedup_key": key}
+
+    if not rows:
+        return []
+
+    stmt = (
+        conflict_insert(db, Job)
+        .on_conflict_do_nothing(index_elements=[Job.dedup_key])
+        .returning(Job)
+    )
+
+    values = list(rows.values())
+    batch_size = settings.INGEST_BATCH_SIZE
+    created_jobs = []
+    for start in range(0, len(values), batch_size):
+        batch = values[start:start + batch_size]
+        keys = [row["dedup_key"] for row in batch]
+        archived = set(await db.scalars(select(JobArchive.dedup_key).where(JobArchive.dedup_key.in_(keys))))
+        batch = [row for row in batch if row["dedup_key"] not in archived]
+        if batch:
+            created_jobs.extend(await db.scalars(stmt, batch))
+
+    # Count only rows that were actually inserted, in the same transaction
+    await apply_facet_deltas(db, facet_deltas(created_jobs))
+    await db.commit()
+
+    if created_jobs:
+        await job_list_cache.invalidate()
+
+    return created_jobs
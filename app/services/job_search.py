@@ -0,0 +1,199 @@
+from datetime import datetime
+from typing import Dict, List, Literal, Optional, Tuple
+from sqlalchemy import Select, func, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+import json
+import time
+
+from app.core.config import settings
+from app.models.job import Job
+from app.services.pagination import decode_cursor, encode_cursor
+
+# Text search configuration used by the jobs.search_vector column
+SEARCH_CONFIG = "english"
+
+# Newest first; matches the ix_jobs_posted_date_id index
+DATE_ORDER = (Job.posted_date.desc().nulls_last(), Job.id.desc())
+
+CountMode = Literal["exact", "estimated", "none"]
+
+# Description in list views: whole, cut to JOB_LIST_SNIPPET_LENGTH, or left out
+DescriptionMode = Literal["full", "snippet", "none"]
+
+# JobResponse fields, in its serialization order
+JOB_LIST_FIELDS = (
+    "title", "company", "location", "platform", "description", "apply_url",
+    "posted_date", "experience_level", "salary_range", "id", "created_at",
+)
+
+# (statement, params) -> (count, expires at) for estimated counts
+_count_cache: Dict[tuple, Tuple[int, float]] = {}
+
+
+def search_query(query: str):
+    """tsquery for user input; accepts quotes, OR and -negation"""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, query)
+
+
+def apply_job_filters(stmt, dialect_name: str, query: Optional[str] = None, location: Optional[str] = None):
+    """
+    Filter a jobs query/select by search text and location.
+
+    On Postgres the search text matches the full-text index over title,
+    company and description, plus trigram-indexed substring and fuzzy
+    matches on title and company. Other dialects fall back to ILIKE.
+    """
+    if query:
+        pattern = f"%{query}%"
+        conditions = [Job.title.ilike(pattern), Job.company.ilike(pattern)]
+        if dialect_name == "postgresql":
+            conditions += [
+                Job.search_vector.op("@@")(search_query(query)),
+                # Trigram similarity (pg_trgm `%`) catches typos
+                Job.title.op("%")(query),
+            ]
+        stmt = stmt.where(or_(*conditions))
+
+    if location:
+        stmt = stmt.where(Job.location.ilike(f"%{location}%"))
+
+    return stmt
+
+
+def relevance(query: str):
+    """Ranking expression for search results (Postgres only)"""
+    return (
+        func.ts_rank_cd(Job.search_vector, search_query(query))
+        + func.similarity(Job.title, query)
+    )
+
+
+def job_list_columns(description: DescriptionMode = "full") -> list:
+    """
+    Columns for a job list select. A snippet reads only the start of the
+    description from the database, one character more than is shown so
+    job_list_rows can tell whether it was cut.
+    """
+    columns = []
+    for name in JOB_LIST_FIELDS:
+        if name == "description" and description == "none":
+            continue
+        if name == "description" and description == "snippet":
+            length = settings.JOB_LIST_SNIPPET_LENGTH + 1
+            columns.append(func.substr(Job.description, 1, length).label("description"))
+            continue
+        columns.append(getattr(Job, name))
+    return columns
+
+
+def job_list_rows(rows, description: DescriptionMode = "full") -> List[dict]:
+    """
+    JobResponse-shaped dicts for rows of a job_list_columns select.
+    The rows come straight from the jobs table, so they are not validated
+    again through JobResponse.
+    """
+    jobs = [row._asdict() for row in rows]
+    if description == "snippet":
+        length = settings.JOB_LIST_SNIPPET_LENGTH
+        for job in jobs:
+            text = job["description"]
+            if text and len(text) > length:
+                job["description"] = text[:length].rstrip() + "…"
+    return jobs
+
+
+async def _fetch(db: AsyncSession, stmt: Select) -> list:
+    """Entities for select(Job), rows for a select of columns"""
+    if len(stmt.column_descriptions) == 1:
+        return list(await db.scalars(stmt))
+    return list((await db.execute(stmt)).all())
+
+
+async def page_by_date(db: AsyncSession, stmt: Select, limit: int, cursor: Optional[str] = None, skip: int = 0):
+    """
+    Fetch one newest-first page of a jobs select, either select(Job) or
+    a select of columns that includes posted_date and id.
+
+    With a cursor the page starts right after the row the cursor was
+    made from (keyset pagination), so deep pages cost the same as the
+    first one; otherwise skip is used as an offset. Returns the jobs and
+    the cursor for the next page, or None on the last page.
+
+    Raises InvalidCursorError for a malformed cursor.
+    """
+    ordered = stmt.order_by(*DATE_ORDER)
+    if cursor is None:
+        jobs = await _fetch(db, ordered.offset(skip).limit(limit + 1))
+    else:
+        posted_date, job_id = decode_cursor(cursor, (datetime, type(None)), int)
+        if posted_date is not None:
+            # Remaining dated rows, then the undated ones (NULLS LAST)
+            jobs = await _fetch(db, ordered.where(
+                Job.posted_date.isnot(None),
+                tuple_(Job.posted_date, Job.id) < (posted_date, job_id),
+            ).limit(limit + 1))
+            if len(jobs) <= limit:
+                jobs += await _fetch(
+                    db, ordered.where(Job.posted_date.is_(None)).limit(limit + 1 - len(jobs))
+                )
+        else:
+            jobs = await _fetch(
+                db, ordered.where(Job.posted_date.is_(None), Job.id < job_id).limit(limit + 1)
+            )
+
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        next_cursor = encode_cursor(jobs[-1].posted_date, jobs[-1].id)
+    return jobs, next_cursor
+
+
+async def _planner_estimate(db: AsyncSession, stmt: Select) -> int:
+    """Row estimate from EXPLAIN; cheap, but only as good as the table statistics"""
+    conn = await db.connection()
+    compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _exact_count(db: AsyncSession, stmt: Select) -> int:
+    return await db.scalar(stmt.with_only_columns(func.count(Job.id)).order_by(None))
+
+
+async def _cached_count(db: AsyncSession, stmt: Select) -> int:
+    compiled = stmt.compile(dialect=db.bind.dialect)
+    key = (str(compiled), tuple(sorted(compiled.params.items())))
+    now = time.monotonic()
+    cached = _count_cache.get(key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    count = await _exact_count(db, stmt)
+    # Drop expired entries so distinct searches don't pile up
+    for stale_key in [k for k, (_, expires) in _count_cache.items() if expires <= now]:
+        del _count_cache[stale_key]
+    _count_cache[key] = (count, now + settings.JOB_COUNT_CACHE_TTL)
+    return count
+
+
+async def count_jobs(db: AsyncSession, stmt: Select, mode: CountMode = "exact") -> Optional[int]:
+    """
+    Total for a jobs select.
+
+    exact runs COUNT(*). estimated uses the Postgres planner's row
+    estimate, or an exact count cached for JOB_COUNT_CACHE_TTL seconds on
+    other databases. none skips counting and returns None.
+    """
+    if mode == "none":
+        return None
+    if mode == "estimated":
+        if db.bind.dialect.name == "postgresql":
+            return await _planner_estimate(db, stmt)
+        return await _cached_count(db, stmt)
+    return await _exact_count(db, stmt)
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Any, List
+import base64
+import json
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def _encode_value(value: Any):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any):
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque, URL-safe cursor for the sort key of the last row on a page"""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types) -> List[Any]:
+    """
+    Decode a cursor made by encode_cursor.
+
+    `types` gives the expected type (or tuple of types, as for
+    isinstance) of each sort key value, e.g. (datetime, type(None)), int.
+    Values of any other type, which only a tampered cursor can hold, are
+    rejected with InvalidCursorError rather than reaching the database.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("unexpected cursor shape")
+        values = [_decode_value(value) for value in values]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    for value, expected in zip(values, types):
+        # bool is an int subclass, but never a valid sort key
+        if isinstance(value, bool) or not isinstance(value, expected):
+            raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return values
@@ -0,0 +1,415 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Tuple
+from urllib.parse import urlsplit
+import asyncio
+import hashlib
+import json
+import logging
+import time
+
+from app.core.config import settings
+from app.services.etags import content_etag, make_etag
+
+logger = logging.getLogger(__name__)
+
+# Redis key holding the shared invalidation generation
+GENERATION_KEY = "jobs:generation"
+KEY_PREFIX = "jobs:list:"
+
+# Seconds to skip Redis after it fails, so a dead server costs one timeout
+REDIS_RETRY_AFTER = 5.0
+
+HIT = "HIT"
+MISS = "MISS"
+BYPASS = "BYPASS"
+
+
+class RespError(Exception):
+    """Error reply from the Redis server"""
+
+
+class RespClient:
+    """
+    Minimal asyncio client for the Redis protocol (RESP2).
+
+    Supports redis://[:password@]host[:port][/db] URLs and sends one
+    command at a time over a single connection, which is plenty for the
+    small GET/SET/INCR traffic of the result cache. The connection is
+    dropped on any I/O error or timeout and reopened on the next call.
+    """
+
+    def __init__(self, url: str, timeout: float):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.password = parts.password
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def address(self) -> str:
+        return f"{self.host}:{self.port}/{self.db}"
+
+    @staticmethod
+    def encode(args) -> bytes:
+        out = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode()
+            out.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(out)
+
+    async def _read_reply(self) -> Any:
+        line = await self._reader.readuntil(b"\r\n")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RespError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            size = int(rest)
+            if size < 0:
+                return None
+            return (await self._reader.readexactly(size + 2))[:-2]
+        if kind == b"*":
+            size = int(rest)
+            if size < 0:
+                return None
+            return [await self._read_reply() for _ in range(size)]
+        raise ConnectionError(f"Unexpected reply from Redis: {line[:50]!r}")
+
+    async def _call(self, *args) -> Any:
+        self._writer.write(self.encode(args))
+        await self._writer.drain()
+        return await self._read_reply()
+
+    async def _connect(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        if self.password:
+            await self._call("AUTH", self.password)
+        if self.db:
+            await self._call("SELECT", self.db)
+
+    async def execute(self, *args) -> Any:
+        async with self._lock:
+            try:
+                if self._writer is None:
+                    await asyncio.wait_for(self._connect(), self.timeout)
+                return await asyncio.wait_for(self._call(*args), self.timeout)
+            except (OSError, EOFError, asyncio.TimeoutError):
+                # A half-read reply would desync the connection
+                self._close()
+                raise
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def aclose(self):
+        async with self._lock:
+            self._close()
+
+
+@dataclass
+class QueryCacheStats:
+    hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    invalidations: int = 0
+    redis_errors: int = 0
+    # Time spent answering hits and misses, for the latency saved estimate
+    hit_seconds: float = 0.0
+    miss_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        hits = self.hits + self.redis_hits
+        lookups = hits + self.misses
+        avg_hit = self.hit_seconds / hits if hits else 0.0
+        avg_miss = self.miss_seconds / self.misses if self.misses else 0.0
+        return {
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "invalidations": self.invalidations,
+            "redis_errors": self.redis_errors,
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            "avg_hit_ms": round(avg_hit * 1000, 3),
+            "avg_miss_ms": round(avg_miss * 1000, 3),
+            "saved_seconds": round(hits * max(avg_miss - avg_hit, 0.0), 3),
+        }
+
+
+@dataclass
+class _Entry:
+    generation: int
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class QueryResultCache:
+    """
+    Two-tier cache of serialized query results.
+
+    Lookups go to an in-process LRU, then to Redis when redis_url is set
+    (shared by every worker process), and finally compute the result.
+    Entries live for `ttl` seconds and carry the generation they were
+    computed under; invalidate() bumps the generation, so every older
+    entry misses from then on without having to find and delete it.
+
+    With Redis the generation is shared too and re-read at most every
+    `generation_sync` seconds, which bounds how long another process
+    serves results from before a write. Without Redis each process only
+    sees its own invalidations and the TTL bounds staleness. Results
+    computed within `settle_seconds` of an invalidation are not stored,
+    so a lagging read replica can't refill the cache with old rows.
+    Redis errors are logged and the request falls back to the database;
+    an invalidation that couldn't reach Redis is published once it can.
+
+    Every result comes with an ETag, kept with the entry. While the
+    generation is shared through Redis the ETag is derived from the key
+    and generation, so etag() can answer a conditional request without
+    computing anything. Otherwise (no Redis, Redis unreachable, or a
+    result from the settle window) it is a hash of the body.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        redis_url: Optional[str] = None,
+        redis_timeout: float = 0.2,
+        generation_sync: float = 1.0,
+        settle_seconds: float = 0.0,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.generation_sync = generation_sync
+        self.settle_seconds = settle_seconds
+        self.redis = RespClient(redis_url, redis_timeout) if redis_url else None
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._generation = 0
+        self._generation_checked = float("-inf")
+        self._generation_changed = float("-inf")
+        self._unpublished_invalidation = False
+        self._redis_down_until = 0.0
+        self.stats = QueryCacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @staticmethod
+    def key(namespace: str, **params) -> str:
+        """Cache key for normalized request parameters"""
+        raw = json.dumps(params, sort_keys=True, default=str)
+        return KEY_PREFIX + namespace + ":" + hashlib.sha256(raw.encode()).hexdigest()
+
+    async def _redis_call(self, *args) -> Tuple[bool, Any]:
+        """(ok, reply); ok is False when Redis is unset or unavailable"""
+        if self.redis is None or time.monotonic() < self._redis_down_until:
+            return False, None
+        try:
+            return True, await self.redis.execute(*args)
+        except (OSError, EOFError, asyncio.TimeoutError, RespError) as e:
+            self.stats.redis_errors += 1
+            if not isinstance(e, RespError):
+                logger.warning(f"Result cache Redis at {self.redis.address} unavailable: {e!r}")
+                self._redis_down_until = time.monotonic() + REDIS_RETRY_AFTER
+            return False, None
+
+    def _set_generation(self, generation: int):
+        if generation != self._generation:
+            self._generation = generation
+            self._generation_changed = time.monotonic()
+            self._entries.clear()
+
+    async def _seed_generation(self):
+        # Start from the clock rather than 0, so a flushed or restarted Redis
+        # never hands out a generation (and with it an ETag) used before
+        await self._redis_call("SET", GENERATION_KEY, int(time.time() * 1000), "NX")
+
+    def _generation_shared(self) -> bool:
+        """Whether the local generation is the one every process sees"""
+        return (
+            self.redis is not None
+            and time.monotonic() - self._generation_checked <= self.generation_sync
+        )
+
+    async def _incr_generation(self) -> Tuple[bool, Any]:
+        await self._seed_generation()
+        return await self._redis_call("INCR", GENERATION_KEY)
+
+    async def generation(self) -> int:
+        now = time.monotonic()
+        if self.redis is not None and now - self._generation_checked >= self.generation_sync:
+            if self._unpublished_invalidation:
+                # Other processes never heard of a write made while Redis was down
+                ok, value = await self._incr_generation()
+                self._unpublished_invalidation = not ok
+            else:
+                ok, value = await self._redis_call("GET", GENERATION_KEY)
+                if ok and value is None:
+                    await self._seed_generation()
+                    ok, value = await self._redis_call("GET", GENERATION_KEY)
+            if ok:
+                self._generation_checked = now
+                self._set_generation(int(value or 0))
+        return self._generation
+
+    async def invalidate(self):
+        """Make every cached result stale, in all processes when Redis is used"""
+        self.stats.invalidations += 1
+        ok, value = await self._incr_generation()
+        self._unpublished_invalidation = self.redis is not None and not ok
+        self._set_generation(value if ok else self._generation + 1)
+        self._generation_checked = time.monotonic() if ok else float("-inf")
+
+    def _get_local(self, key: str, generation: int) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.generation != generation or entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _set_local(self, key: str, generation: int, body: bytes, etag: str, ttl: float):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = _Entry(generation, body, etag, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _get_redis(self, key: str, generation: int) -> Optional[Tuple[bytes, str, float]]:
+        """(body, etag, remaining ttl) for a current Redis entry"""
+        ok, reply = await self._redis_call("GET", key)
+        if not ok or reply is None:
+            return None
+        # Stored as b"<generation>:<expires at, unix time>:<etag>:<body>"
+        try:
+            stored_generation, expires_at, etag, body = reply.split(b":", 3)
+            remaining = float(expires_at) - time.time()
+            stored_generation = int(stored_generation)
+        except ValueError:
+            return None
+        if stored_generation != generation or remaining <= 0 or not etag.startswith((b'"', b'W/"')):
+            return None
+        return body, etag.decode(), remaining
+
+    @staticmethod
+    def _generation_etag(key: str, generation: int) -> str:
+        # Weak: estimated totals may differ between equivalent results
+        return "W/" + make_etag(key, generation)
+
+    async def etag(self, key: str) -> Optional[str]:
+        """
+        ETag that key's result has under the current generation, without
+        computing it; None when the generation isn't shared, as then
+        another process may have written without this one knowing.
+        """
+        generation = await self.generation()
+        if not self._generation_shared():
+            return None
+        return self._generation_etag(key, generation)
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[bytes]]
+    ) -> Tuple[bytes, str, str]:
+        """
+        Cached result for key, or compute() stored under the current
+        generation. Returns (body, its ETag, HIT/MISS/BYPASS).
+        """
+        start = time.perf_counter()
+        # Read before computing: a write landing mid-query leaves the
+        # result under the old generation, where it can never be served
+        generation = await self.generation()
+        shared = self._generation_shared()
+
+        if not self.enabled:
+            body = await compute()
+            return body, self._result_etag(key, generation, body, shared), BYPASS
+
+        entry = self._get_local(key, generation)
+        if entry is not None:
+            self.stats.hits += 1
+            self.stats.hit_seconds += time.perf_counter() - start
+            return entry.body, entry.etag, HIT
+
+        cached = await self._get_redis(key, generation)
+        if cached is not None:
+            body, etag, remaining = cached
+            self._set_local(key, generation, body, etag, min(remaining, self.ttl))
+            self.stats.redis_hits += 1
+            self.stats.hit_seconds += time.perf_counter() - start
+            return body, etag, HIT
+
+        body = await compute()
+        etag = self._result_etag(key, generation, body, shared)
+        if self._settled():
+            self._set_local(key, generation, body, etag, self.ttl)
+            value = b"%d:%.3f:%s:%s" % (generation, time.time() + self.ttl, etag.encode(), body)
+            await self._redis_call("SET", key, value, "PX", max(int(self.ttl * 1000), 1))
+            self.stats.stores += 1
+        self.stats.misses += 1
+        self.stats.miss_seconds += time.perf_counter() - start
+        return body, etag, MISS
+
+    def _settled(self) -> bool:
+        return time.monotonic() - self._generation_changed >= self.settle_seconds
+
+    def _result_etag(self, key: str, generation: int, body: bytes, shared: bool) -> str:
+        """ETag for a freshly computed result"""
+        # A result from the settle window may hold pre-write replica rows,
+        # so it must not claim the new generation
+        if shared and self._settled():
+            return self._generation_etag(key, generation)
+        return content_etag(body)
+
+    def clear(self):
+        self._entries.clear()
+
+    async def aclose(self):
+        if self.redis is not None:
+            await self.redis.aclose()
+
+    def info(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "ttl": self.ttl,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "generation": self._generation,
+            "redis": None if self.redis is None else {
+                "address": self.redis.address,
+                "available": time.monotonic() >= self._redis_down_until,
+            },
+            **self.stats.as_dict(),
+        }
+
+
+job_list_cache = QueryResultCache(
+    ttl=settings.JOB_LIST_CACHE_TTL,
+    max_entries=settings.JOB_LIST_CACHE_MAX_ENTRIES,
+    redis_url=settings.JOB_LIST_CACHE_REDIS_URL,
+    redis_timeout=settings.JOB_LIST_CACHE_REDIS_TIMEOUT,
+    generation_sync=settings.JOB_LIST_CACHE_GENERATION_SYNC,
+    # Replicas may still return pre-write rows for about this long
+    settle_seconds=settings.REPLICA_STICKY_SECONDS if settings.DATABASE_REPLICA_URLS else 0.0,
+)
+
+
+def get_job_list_cache() -> QueryResultCache:
+    """Dependency for the job listing result cache"""
+    return job_list_cache
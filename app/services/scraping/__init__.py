@@ -3,7 +3,8 @@ from app.services.scraping.mock_scraper import MockJobScraper
 from app.services.scraping.linkedin_scraper import LinkedInScraper
 from app.services.scraping.naukri_scraper import NaukriScraper
 from app.services.scraping.unstop_scraper import UnstopScraper
-from app.services.scraping.manager import ScraperManager
+from app.services.scraping.http_client import HttpClientPool
+from app.services.scraping.manager import ScraperManager, scraper_manager
 
 __all__ = [
     "BaseJobScraper", 
@@ -11,5 +12,7 @@ __all__ = [
     "LinkedInScraper", 
     "NaukriScraper", 
     "UnstopScraper",
-    "ScraperManager"
+    "HttpClientPool",
+    "ScraperManager",
+    "scraper_manager",
 ]
@@ -1,36 +1,225 @@
 from abc import ABC, abstractmethod
-from typing import List
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional
+import asyncio
+import logging
+import math
+import httpx
+from app.core.config import settings
 from app.schemas.job import JobCreate
+from app.services.scraping.http_client import build_transport
+from app.services.scraping.rate_limit import (
+    AdaptiveRateLimiter,
+    backoff_delay,
+    parse_retry_after,
+)
+
+logger = logging.getLogger(__name__)
+
+# Statuses that signal throttling or a transient server-side failure
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+
+class PageFetchError(Exception):
+    """A result page could not be fetched, as opposed to being empty"""
+
+
+@dataclass
+class ScrapedPage:
+    """One page of results from a platform"""
+    jobs: List[JobCreate]
+    # Results the platform returned, before parsing and filtering
+    result_count: int
 
 
 class BaseJobScraper(ABC):
     """
     Abstract base class for job scrapers.
-    
-    All job scrapers must implement the scrape() method
-    to fetch and normalize job data from their respective platforms.
+
+    Scrapers implement fetch_page() to fetch and normalize a single page
+    of results; scrape() takes care of pagination, fetching pages
+    concurrently and stopping once the platform returns an empty or
+    short page. Pages that fail to fetch are skipped.
+
+    Scrapers may be given a shared, long-lived httpx client (see
+    HttpClientPool). Without one, a short-lived client is opened per call.
+    Requests made through get() are throttled by the platform's shared
+    rate limiter and retried with backoff on 429s and transient errors.
+    Throttling happens in the client's RateLimitedTransport (see
+    build_transport), so clients must be built with it to be limited.
     """
-    
+
+    # Number of results the platform returns per page
+    page_size: int = 20
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    ):
+        self.client = client
+        self.rate_limiter = rate_limiter
+
     @property
     @abstractmethod
     def platform_name(self) -> str:
         """Return the name of the platform being scraped"""
         pass
-    
+
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of pages fetched at once for this platform"""
+        return settings.SCRAPER_PLATFORM_PAGE_CONCURRENCY.get(
+            self.platform_name, settings.SCRAPER_PAGE_CONCURRENCY
+        )
+
     @abstractmethod
-    async def scrape(self, query: str = None, location: str = None) -> List[JobCreate]:
+    async def fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        query: str = None,
+        location: str = None,
+        page: int = 0,
+    ) -> ScrapedPage:
+        """
+        Fetch a single page of jobs from the platform.
+
+        Args:
+            client: HTTP client to issue requests with
+            query: Job search query (e.g., "Software Engineer")
+            location: Location filter (e.g., "New York")
+            page: Zero-based page number
+
+        Returns:
+            The normalized jobs and how many results the platform sent
+
+        Raises:
+            PageFetchError (or any other exception) when the page could
+            not be fetched
+        """
+        pass
+
+    async def scrape(
+        self,
+        query: str = None,
+        location: str = None,
+        max_pages: Optional[int] = None,
+        max_results: Optional[int] = None,
+    ) -> List[JobCreate]:
         """
         Scrape jobs from the platform.
-        
+
         Args:
             query: Job search query (e.g., "Software Engineer")
             location: Location filter (e.g., "New York")
-            
+            max_pages: Maximum number of pages to fetch
+            max_results: Maximum number of jobs to return
+
         Returns:
             List of normalized job data as JobCreate schemas
         """
-        pass
-    
+        if max_pages is None:
+            if max_results is not None:
+                max_pages = math.ceil(max_results / self.page_size)
+            else:
+                max_pages = settings.SCRAPER_DEFAULT_MAX_PAGES
+        if max_results is not None:
+            max_pages = min(max_pages, math.ceil(max_results / self.page_size))
+        max_pages = max(max_pages, 1)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # First page known to be the last one; later pages are skipped
+        last_page = max_pages - 1
+
+        async def run(client: httpx.AsyncClient, page: int) -> List[JobCreate]:
+            nonlocal last_page
+            if page > last_page:
+                return []
+            async with semaphore:
+                if page > last_page:
+                    return []
+                try:
+                    result = await self.fetch_page(client, query, location, page)
+                except Exception as e:
+                    # Skipped, not taken as the end of the results
+                    logger.warning(f"{self.platform_name}: page {page} failed: {e!r}")
+                    return []
+            # Cards dropped while parsing don't make a page short
+            if result.result_count < self.page_size:
+                last_page = min(last_page, page)
+            return result.jobs
+
+        async with self.http_client(timeout=settings.SCRAPER_TIMEOUT, follow_redirects=True) as client:
+            pages = await asyncio.gather(*(run(client, page) for page in range(max_pages)))
+
+        jobs = [job for page_jobs in pages[:last_page + 1] for job in page_jobs]
+        if max_results is not None:
+            jobs = jobs[:max_results]
+        return jobs
+
+    async def get(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """
+        GET a URL under the platform rate limit.
+
+        Throttling responses feed back into the limiter and are retried
+        after Retry-After or an exponential backoff with jitter. The last
+        response is returned once retries are exhausted.
+        """
+        attempt = 0
+        extensions = {"rate_limiter": self.rate_limiter} if self.rate_limiter is not None else None
+        while True:
+            try:
+                response = await client.get(url, extensions=extensions, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= settings.SCRAPER_MAX_RETRIES:
+                    raise
+                delay = backoff_delay(attempt, settings.SCRAPER_BACKOFF_BASE, settings.SCRAPER_BACKOFF_MAX)
+                logger.warning(f"{self.platform_name}: {e!r}, retrying in {delay:.2f}s")
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code not in RETRYABLE_STATUSES:
+                from_cache = response.extensions.get("from_cache", False)
+                if self.rate_limiter is not None and response.status_code < 400 and not from_cache:
+                    self.rate_limiter.on_success()
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if self.rate_limiter is not None and response.status_code in THROTTLE_STATUSES:
+                self.rate_limiter.on_throttle(retry_after)
+
+            if attempt >= settings.SCRAPER_MAX_RETRIES:
+                return response
+            if retry_after is not None and retry_after > settings.SCRAPER_BACKOFF_MAX:
+                # Longer pauses are left to the shared limiter for later scrapes
+                return response
+
+            delay = backoff_delay(attempt, settings.SCRAPER_BACKOFF_BASE, settings.SCRAPER_BACKOFF_MAX)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            logger.warning(
+                f"{self.platform_name}: status {response.status_code}, retrying in {delay:.2f}s"
+            )
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def http_client(self, **kwargs) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Yield the shared client if one was provided, otherwise a
+        temporary client built from kwargs that is closed afterwards.
+        """
+        if self.client is not None and not self.client.is_closed:
+            yield self.client
+            return
+
+        transport = build_transport(httpx.AsyncHTTPTransport())
+        async with httpx.AsyncClient(transport=transport, **kwargs) as client:
+            yield client
+
     def normalize_job(self, raw_job: dict) -> JobCreate:
         """
         Normalize raw job data to JobCreate schema.
@@ -0,0 +1,276 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from collections import OrderedDict
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Request headers that change the response body and so belong in the key
+VARY_HEADERS = ("accept", "accept-language")
+
+# Headers describing the original transfer, not the cached body
+HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "content-length"}
+
+
+def normalize_url(url: httpx.URL) -> str:
+    """Lowercase scheme/host and sort query parameters"""
+    parts = urlsplit(str(url))
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+
+def cache_key(request: httpx.Request) -> str:
+    vary = "\n".join(f"{name}:{request.headers.get(name, '')}" for name in VARY_HEADERS)
+    raw = f"{request.method}\n{normalize_url(request.url)}\n{vary}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    stored_at: float
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self._header("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self._header("last-modified")
+
+    def _header(self, name: str) -> Optional[str]:
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stores: int = 0
+    bytes_served: int = 0
+
+    def as_dict(self) -> dict:
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "stores": self.stores,
+            "bytes_served": self.bytes_served,
+            "hit_ratio": round((self.hits + self.revalidated) / lookups, 3) if lookups else 0.0,
+        }
+
+
+class DiskCacheBackend:
+    """
+    On-disk response store with size-based LRU eviction.
+
+    Each entry is a `<key>.body` file plus a `<key>.meta` JSON file.
+    Recency is tracked through file mtimes so LRU order survives
+    restarts. Methods block on disk I/O; call them from a thread.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+    def _load_index(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".meta"):
+                continue
+            key = name[:-5]
+            try:
+                body_stat = os.stat(self._path(key, "body"))
+                meta_stat = os.stat(self._path(key, "meta"))
+            except FileNotFoundError:
+                self._remove_files(key)
+                continue
+            entries.append((meta_stat.st_mtime, key, body_stat.st_size + meta_stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+
+    def _remove_files(self, key: str):
+        for suffix in ("body", "meta"):
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            if key not in self._index:
+                return None
+            try:
+                with open(self._path(key, "meta")) as f:
+                    meta = json.load(f)
+                with open(self._path(key, "body"), "rb") as f:
+                    body = f.read()
+            except (OSError, ValueError):
+                self._size -= self._index.pop(key)
+                self._remove_files(key)
+                return None
+            self._index.move_to_end(key)
+            try:
+                os.utime(self._path(key, "meta"))
+            except OSError:
+                # Evicted by another process since the read; the body we
+                # already have is still good for this lookup
+                self._size -= self._index.pop(key)
+        return CacheEntry(
+            status_code=meta["status_code"],
+            headers=[tuple(h) for h in meta["headers"]],
+            body=body,
+            stored_at=meta["stored_at"],
+        )
+
+    def set(self, key: str, entry: CacheEntry):
+        meta = json.dumps({
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "stored_at": entry.stored_at,
+        }).encode()
+        size = len(meta) + len(entry.body)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            # Write the body first; an entry only counts once its meta exists
+            with open(self._path(key, "body"), "wb") as f:
+                f.write(entry.body)
+            with open(self._path(key, "meta"), "wb") as f:
+                f.write(meta)
+            self._size -= self._index.pop(key, 0)
+            self._index[key] = size
+            self._size += size
+            while self._size > self.max_bytes and self._index:
+                evicted, evicted_size = self._index.popitem(last=False)
+                self._size -= evicted_size
+                self._remove_files(evicted)
+
+    def touch(self, key: str, stored_at: float):
+        """Mark a revalidated entry as fresh again"""
+        entry = self.get(key)
+        if entry is not None:
+            entry.stored_at = stored_at
+            self.set(key, entry)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that caches GET responses for one platform.
+
+    Fresh entries (younger than ttl) are served without touching the
+    network. Stale entries with an ETag or Last-Modified are revalidated
+    with If-None-Match / If-Modified-Since and a 304 serves the cached
+    body. Responses served from the cache carry `from_cache` in their
+    extensions.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        backend: DiskCacheBackend,
+        ttl: float,
+        stats: Optional[CacheStats] = None,
+    ):
+        self._transport = transport
+        self.backend = backend
+        self.ttl = ttl
+        self.stats = stats or CacheStats()
+
+    def _response(self, request: httpx.Request, entry: CacheEntry) -> httpx.Response:
+        self.stats.bytes_served += len(entry.body)
+        return httpx.Response(
+            status_code=entry.status_code,
+            headers=entry.headers,
+            content=entry.body,
+            request=request,
+            extensions={"from_cache": True},
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET" or self.ttl <= 0:
+            return await self._transport.handle_async_request(request)
+
+        key = cache_key(request)
+        entry = await asyncio.to_thread(self.backend.get, key)
+        now = time.time()
+
+        if entry is not None and now - entry.stored_at < self.ttl:
+            self.stats.hits += 1
+            return self._response(request, entry)
+
+        if entry is not None:
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = await self._transport.handle_async_request(request)
+
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            self.stats.revalidated += 1
+            await asyncio.to_thread(self.backend.touch, key, now)
+            return self._response(request, entry)
+
+        self.stats.misses += 1
+        cache_control = response.headers.get("cache-control", "").lower()
+        if response.status_code != 200 or "no-store" in cache_control:
+            return response
+
+        skip_headers = HOP_BY_HOP_HEADERS
+        if response.is_stream_consumed:
+            # Already read (and decoded) by an inner transport
+            body = response.content
+            skip_headers = skip_headers | {"content-encoding"}
+        else:
+            # Keep the raw (still content-encoded) bytes; the client decodes them
+            body = b"".join([chunk async for chunk in response.aiter_raw()])
+        await response.aclose()
+        headers = [
+            (name, value) for name, value in response.headers.multi_items()
+            if name.lower() not in skip_headers
+        ]
+        entry = CacheEntry(status_code=200, headers=headers, body=body, stored_at=now)
+        await asyncio.to_thread(self.backend.set, key, entry)
+        self.stats.stores += 1
+
+        return httpx.Response(
+            status_code=200,
+            headers=headers,
+            content=body,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self):
+        await self._transport.aclose()
@@ -0,0 +1,127 @@
+from typing import Callable, Dict, Optional
+import importlib.util
+import logging
+import httpx
+
+from app.core.config import settings
+from app.services.scraping.http_cache import CacheStats, CachingTransport, DiskCacheBackend
+from app.services.scraping.rate_limit import RateLimitedTransport
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional `h2` package (installed via httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def build_transport(
+    network: httpx.AsyncBaseTransport,
+    cache: Optional[DiskCacheBackend] = None,
+    cache_ttl: float = 0,
+    cache_stats: Optional[CacheStats] = None,
+) -> httpx.AsyncBaseTransport:
+    """
+    Stack the scraper transport layers:
+    HTTP cache -> rate limiter -> network.
+    """
+    transport: httpx.AsyncBaseTransport = RateLimitedTransport(network)
+    if cache is not None and cache_ttl > 0:
+        transport = CachingTransport(transport, cache, ttl=cache_ttl, stats=cache_stats)
+    return transport
+
+
+class HttpClientPool:
+    """
+    Long-lived pool of HTTP clients shared by all scrapers.
+
+    Each platform gets its own httpx.AsyncClient so connection limits
+    can be tuned per site, while keep-alive connections are reused
+    across scrapes instead of paying a TCP/TLS handshake every time.
+    Responses go through a shared on-disk HTTP cache with a per-platform
+    TTL when SCRAPER_HTTP_CACHE_ENABLED is set.
+
+    network_factory replaces the real network transport, per platform
+    (used by the offline replay benchmarks).
+    """
+
+    def __init__(
+        self,
+        network_factory: Optional[Callable[[str], httpx.AsyncBaseTransport]] = None,
+    ):
+        self.network_factory = network_factory
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._closed = False
+        self.cache_stats: Dict[str, CacheStats] = {}
+        self.cache: Optional[DiskCacheBackend] = None
+        if settings.SCRAPER_HTTP_CACHE_ENABLED:
+            self.cache = DiskCacheBackend(
+                settings.SCRAPER_HTTP_CACHE_DIR,
+                settings.SCRAPER_HTTP_CACHE_MAX_BYTES,
+            )
+
+    def _limits_for(self, platform: str) -> httpx.Limits:
+        max_connections = settings.SCRAPER_PLATFORM_MAX_CONNECTIONS.get(
+            platform, settings.SCRAPER_MAX_CONNECTIONS
+        )
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(
+                settings.SCRAPER_MAX_KEEPALIVE_CONNECTIONS, max_connections
+            ),
+            keepalive_expiry=settings.SCRAPER_KEEPALIVE_EXPIRY,
+        )
+
+    def _network_transport(self, platform: str) -> httpx.AsyncBaseTransport:
+        if self.network_factory is not None:
+            return self.network_factory(platform)
+        http2 = settings.SCRAPER_HTTP2 and HTTP2_AVAILABLE
+        logger.debug(f"Creating HTTP transport for {platform} (http2={http2})")
+        return httpx.AsyncHTTPTransport(limits=self._limits_for(platform), http2=http2)
+
+    def get(self, platform: str) -> httpx.AsyncClient:
+        """Return the shared client for a platform, creating it on first use"""
+        if self._closed:
+            raise RuntimeError("HTTP client pool is closed")
+
+        client = self._clients.get(platform)
+        if client is None:
+            stats = self.cache_stats.setdefault(platform, CacheStats())
+            transport = build_transport(
+                self._network_transport(platform),
+                cache=self.cache,
+                cache_ttl=settings.SCRAPER_PLATFORM_HTTP_CACHE_TTL.get(
+                    platform, settings.SCRAPER_HTTP_CACHE_TTL
+                ),
+                cache_stats=stats,
+            )
+            client = httpx.AsyncClient(
+                transport=transport,
+                timeout=settings.SCRAPER_TIMEOUT,
+                follow_redirects=True,
+            )
+            self._clients[platform] = client
+        return client
+
+    def cache_info(self) -> dict:
+        """HTTP cache hit/miss counters per platform"""
+        return {
+            "enabled": self.cache is not None,
+            "size_bytes": self.cache.size if self.cache is not None else 0,
+            "platforms": {
+                platform: stats.as_dict()
+                for platform, stats in self.cache_stats.items()
+            },
+        }
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def aclose(self):
+        """Close every client and release pooled connections"""
+        self._closed = True
+        clients, self._clients = self._clients, {}
+        for platform, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"Failed to close HTTP client for {platform}: {e}")
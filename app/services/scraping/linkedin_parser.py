@@ -0,0 +1,99 @@
+"""
+LinkedIn search result parsers.
+
+Both parsers are plain functions over the HTML text so they can run in a
+thread or process pool (see parse_pool). They return raw job dicts that
+the scraper normalizes, plus the number of cards on the page, including
+ones skipped for lacking a title or company.
+
+- parse_cards_lxml: direct lxml/XPath extraction, no soup tree
+- parse_cards_soup: the original BeautifulSoup implementation
+"""
+from typing import List, Optional, Tuple
+from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+
+
+def _has_class(tag: str, class_name: str) -> etree.XPath:
+    # Matches one token of a space separated class attribute, like bs4's class_=
+    return etree.XPath(
+        f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')][1]"
+    )
+
+
+_CARDS = etree.XPath("//li")
+_TITLE = _has_class("h3", "base-search-card__title")
+_COMPANY = _has_class("h4", "base-search-card__subtitle")
+_LOCATION = _has_class("span", "job-search-card__location")
+_LINK = _has_class("a", "base-card__full-link")
+
+
+def _text(element) -> str:
+    # Same result as bs4's get_text(strip=True)
+    return "".join(part.strip() for part in element.itertext())
+
+
+def _first(xpath: etree.XPath, card) -> Optional[etree._Element]:
+    found = xpath(card)
+    return found[0] if found else None
+
+
+def parse_cards_lxml(text: str, fallback_location: Optional[str] = None) -> Tuple[List[dict], int]:
+    """Extract job cards with compiled XPath expressions"""
+    if not text or not text.strip():
+        return [], 0
+
+    root = lxml_html.fromstring(text)
+    cards = _CARDS(root)
+    jobs = []
+    for card in cards:
+        title_tag = _first(_TITLE, card)
+        company_tag = _first(_COMPANY, card)
+        if title_tag is None or company_tag is None:
+            continue
+
+        location_tag = _first(_LOCATION, card)
+        link_tag = _first(_LINK, card)
+        company = _text(company_tag)
+        jobs.append({
+            "title": _text(title_tag),
+            "company": company,
+            "location": _text(location_tag) if location_tag is not None else fallback_location,
+            "apply_url": link_tag.get("href") if link_tag is not None else None,
+            "description": f"Job at {company} on LinkedIn",
+        })
+    return jobs, len(cards)
+
+
+def parse_cards_soup(text: str, fallback_location: Optional[str] = None) -> Tuple[List[dict], int]:
+    """Extract job cards by building a full BeautifulSoup tree"""
+    soup = BeautifulSoup(text, "lxml")
+    cards = soup.find_all("li")
+    jobs = []
+    for card in cards:
+        try:
+            title_tag = card.find("h3", class_="base-search-card__title")
+            company_tag = card.find("h4", class_="base-search-card__subtitle")
+            location_tag = card.find("span", class_="job-search-card__location")
+            link_tag = card.find("a", class_="base-card__full-link")
+
+            if not title_tag or not company_tag:
+                continue
+
+            jobs.append({
+                "title": title_tag.get_text(strip=True),
+                "company": company_tag.get_text(strip=True),
+                "location": location_tag.get_text(strip=True) if location_tag else fallback_location,
+                "apply_url": link_tag["href"] if link_tag else None,
+                "description": f"Job at {company_tag.get_text(strip=True)} on LinkedIn",
+            })
+        except Exception as e:
+            print(f"Error parsing LinkedIn job: {e}")
+            continue
+    return jobs, len(cards)
+
+
+PARSERS = {
+    "lxml": parse_cards_lxml,
+    "soup": parse_cards_soup,
+}
@@ -1,57 +1,283 @@
-from typing import List
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
 import asyncio
+import logging
+import httpx
+from app.core.config import settings
 from app.services.scraping.base import BaseJobScraper
+from app.services.scraping.http_client import HttpClientPool
+from app.services.scraping.parse_pool import shutdown_parse_executor
+from app.services.scraping.rate_limit import AdaptiveRateLimiter
+from app.services.scraping.result_cache import ScrapeResultCache, STALE
 from app.schemas.job import JobCreate
 from app.services.scraping.mock_scraper import MockJobScraper
 from app.services.scraping.linkedin_scraper import LinkedInScraper
 from app.services.scraping.naukri_scraper import NaukriScraper
 from app.services.scraping.unstop_scraper import UnstopScraper
 
+logger = logging.getLogger(__name__)
+
+
 class ScraperManager:
     """
     Manager to coordinate multiple job scrapers.
+    
+    The manager owns the shared HTTP client pool. Call start() once
+    (in the app lifespan) so scrapers reuse warm connections, and
+    aclose() on shutdown.
+    
+    It also owns one rate limiter per platform, shared by every
+    concurrent scrape of that platform, and a cache of normalized
+    results per (platform, query, location). Stale cached results are
+    served immediately while a background refresh fetches new ones.
     """
     
-    def __init__(self):
-        self.scrapers: List[BaseJobScraper] = [
-            LinkedInScraper(),
-            NaukriScraper(),
-            UnstopScraper()
-        ]
+    def __init__(
+        self,
+        network_factory: Optional[Callable[[str], httpx.AsyncBaseTransport]] = None,
+    ):
+        self.network_factory = network_factory
+        self.http_pool: Optional[HttpClientPool] = None
+        self.rate_limiters: Dict[str, AdaptiveRateLimiter] = {}
+        self.result_cache = ScrapeResultCache(
+            ttl=settings.SCRAPER_RESULT_CACHE_TTL,
+            stale_ttl=settings.SCRAPER_RESULT_STALE_TTL,
+            max_entries=settings.SCRAPER_RESULT_CACHE_MAX_ENTRIES,
+        )
+        # Scrapes in progress per cache key, shared by concurrent callers
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        self._refreshes: Set[asyncio.Task] = set()
+        self.scrapers: List[BaseJobScraper] = []
+        for scraper in [LinkedInScraper(), NaukriScraper(), UnstopScraper()]:
+            self.add_scraper(scraper)
     
     def add_scraper(self, scraper: BaseJobScraper):
+        self._attach_client(scraper)
+        if scraper.rate_limiter is None:
+            scraper.rate_limiter = self.get_rate_limiter(scraper.platform_name)
         self.scrapers.append(scraper)
     
-    async def scrape_all(self, query: str = None, location: str = None) -> List[JobCreate]:
+    def get_rate_limiter(self, platform: str) -> AdaptiveRateLimiter:
+        """Return the shared rate limiter for a platform"""
+        limiter = self.rate_limiters.get(platform)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(
+                rate=settings.SCRAPER_PLATFORM_RATE_LIMITS.get(platform, settings.SCRAPER_RATE_LIMIT),
+                burst=settings.SCRAPER_RATE_BURST,
+                min_rate=settings.SCRAPER_MIN_RATE_LIMIT,
+                max_rate=settings.SCRAPER_MAX_RATE_LIMIT,
+            )
+            self.rate_limiters[platform] = limiter
+        return limiter
+    
+    def select_scrapers(self, platforms: Optional[List[str]] = None) -> List[BaseJobScraper]:
+        """Registered scrapers, optionally restricted to the named platforms"""
+        if not platforms:
+            return list(self.scrapers)
+        wanted = {platform.lower() for platform in platforms}
+        return [s for s in self.scrapers if s.platform_name.lower() in wanted]
+    
+    def http_cache_info(self) -> dict:
+        """HTTP cache counters, empty until the client pool is started"""
+        if self.http_pool is None:
+            return {"enabled": False}
+        return self.http_pool.cache_info()
+    
+    def result_cache_info(self) -> dict:
+        """Scrape result cache counters"""
+        return {
+            **self.result_cache.stats(),
+            "refreshing": len(self._refreshes),
+        }
+    
+    def rate_limits(self) -> Dict[str, dict]:
+        """Current allowed rate and throttling state per platform"""
+        return {
+            platform: limiter.snapshot()
+            for platform, limiter in self.rate_limiters.items()
+        }
+    
+    def _attach_client(self, scraper: BaseJobScraper):
+        if self.http_pool is not None and scraper.client is None:
+            scraper.client = self.http_pool.get(scraper.platform_name)
+    
+    async def start(self):
+        """Create the shared HTTP client pool and hand clients to scrapers"""
+        if self.http_pool is not None and not self.http_pool.closed:
+            return
+        self.http_pool = HttpClientPool(network_factory=self.network_factory)
+        for scraper in self.scrapers:
+            scraper.client = None
+            self._attach_client(scraper)
+    
+    async def aclose(self):
+        """Close the shared HTTP client pool and parse workers"""
+        for task in list(self._refreshes) + list(self._inflight.values()):
+            task.cancel()
+        await asyncio.gather(*self._refreshes, *self._inflight.values(), return_exceptions=True)
+        self._refreshes.clear()
+        self._inflight.clear()
+        shutdown_parse_executor()
+        if self.http_pool is None:
+            return
+        await self.http_pool.aclose()
+        self.http_pool = None
+        for scraper in self.scrapers:
+            scraper.client = None
+    
+    @staticmethod
+    def _cache_key(
+        scraper: BaseJobScraper,
+        query: Optional[str],
+        location: Optional[str],
+        max_pages: Optional[int],
+        max_results: Optional[int],
+    ) -> Tuple:
+        return (
+            scraper.platform_name,
+            (query or "").strip().lower(),
+            (location or "").strip().lower(),
+            max_pages,
+            max_results,
+        )
+    
+    def _fetch(
+        self,
+        key: Tuple,
+        scraper: BaseJobScraper,
+        query: Optional[str],
+        location: Optional[str],
+        max_pages: Optional[int],
+        max_results: Optional[int],
+    ) -> asyncio.Task:
+        """Start (or join) a scrape for key that fills the result cache"""
+        task = self._inflight.get(key)
+        if task is not None:
+            return task
+        
+        async def fetch() -> List[JobCreate]:
+            try:
+                jobs = await scraper.scrape(query, location, max_pages=max_pages, max_results=max_results)
+                # Empty results usually mean the site failed; don't cache them
+                if jobs:
+                    self.result_cache.set(key, jobs)
+                return jobs
+            finally:
+                self._inflight.pop(key, None)
+        
+        task = asyncio.create_task(fetch())
+        self._inflight[key] = task
+        return task
+    
+    async def scrape_cached(
+        self,
+        scraper: BaseJobScraper,
+        query: str = None,
+        location: str = None,
+        max_pages: Optional[int] = None,
+        max_results: Optional[int] = None,
+    ) -> List[JobCreate]:
         """
-        Run all registered scrapers in parallel and aggregate results.
+        Scrape one platform through the result cache.
+        
+        Fresh results are returned as is. Stale results are returned
+        immediately and trigger a background refresh. Misses scrape the
+        site, sharing the work with concurrent identical requests.
         """
-        if not self.scrapers:
+        key = self._cache_key(scraper, query, location, max_pages, max_results)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            jobs, state = cached
+            if state == STALE and key not in self._inflight:
+                refresh = self._fetch(key, scraper, query, location, max_pages, max_results)
+                self._refreshes.add(refresh)
+                refresh.add_done_callback(self._refresh_done)
+            return jobs
+        
+        # Shielded so a cancelled caller doesn't cancel the shared scrape
+        return list(await asyncio.shield(
+            self._fetch(key, scraper, query, location, max_pages, max_results)
+        ))
+    
+    def _refresh_done(self, task: asyncio.Task):
+        self._refreshes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background scrape refresh failed: {task.exception()}")
+    
+    async def iter_scrape_all(
+        self,
+        query: str = None,
+        location: str = None,
+        max_pages: Optional[int] = None,
+        max_results: Optional[int] = None,
+        platforms: Optional[List[str]] = None,
+    ) -> AsyncIterator[Tuple[str, List[JobCreate]]]:
+        """
+        Run all registered scrapers in parallel and yield each platform's
+        (platform_name, jobs) batch as soon as that platform finishes.
+        
+        max_pages and max_results are applied per platform. platforms
+        restricts the run to the named platforms (case-insensitive).
+        """
+        scrapers = self.select_scrapers(platforms)
+        if not scrapers:
             # Fallback to mock if no real scrapers allowed or available
             mock = MockJobScraper()
-            return await mock.scrape(query, location)
-            
-        # Run real scrapers in parallel
-        tasks = [scraper.scrape(query, location) for scraper in self.scrapers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            yield mock.platform_name, await mock.scrape(query, location)
+            return
         
-        aggregated_jobs = []
-        for i, result in enumerate(results):
-            scraper_name = self.scrapers[i].platform_name
-            if isinstance(result, list):
+        async def run(scraper: BaseJobScraper) -> Tuple[BaseJobScraper, object]:
+            try:
+                jobs = await self.scrape_cached(scraper, query, location, max_pages, max_results)
+                return scraper, jobs
+            except Exception as e:
+                return scraper, e
+        
+        # Run real scrapers in parallel
+        tasks = [asyncio.create_task(run(scraper)) for scraper in scrapers]
+        found_any = False
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                scraper, result = await next_done
+                scraper_name = scraper.platform_name
+                if isinstance(result, Exception):
+                    print(f"Scraper {scraper_name} error: {result}")
+                    continue
                 if result:
                     print(f"Scraper {scraper_name}: Found {len(result)} jobs")
-                    aggregated_jobs.extend(result)
+                    found_any = True
+                    yield scraper_name, result
                 else:
                     print(f"Scraper {scraper_name}: No jobs found")
-            elif isinstance(result, Exception):
-                print(f"Scraper {scraper_name} error: {result}")
-                
+        finally:
+            # The consumer may stop early; don't leave scrapes running
+            for task in tasks:
+                task.cancel()
+        
         # If all real scrapers failed or found nothing, maybe use mock as a survival strategy 
         # (optional, but let's keep it real for now)
-        if not aggregated_jobs:
+        if not found_any:
             print("No real jobs found, using mock as fallback for demonstration")
             mock = MockJobScraper()
-            return await mock.scrape(query, location)
-            
+            yield mock.platform_name, await mock.scrape(query, location)
+    
+    async def scrape_all(
+        self,
+        query: str = None,
+        location: str = None,
+        max_pages: Optional[int] = None,
+        max_results: Optional[int] = None,
+        platforms: Optional[List[str]] = None,
+    ) -> List[JobCreate]:
+        """
+        Run all registered scrapers in parallel and aggregate results.
+        
+        max_pages and max_results are applied per platform.
+        """
+        aggregated_jobs = []
+        async for _, jobs in self.iter_scrape_all(query, location, max_pages, max_results, platforms):
+            aggregated_jobs.extend(jobs)
         return aggregated_jobs
+
+
+# Shared manager instance, started and closed by the app lifespan
+scraper_manager = ScraperManager()
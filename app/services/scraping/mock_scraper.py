@@ -1,7 +1,6 @@
-from typing import List
+import httpx
 from datetime import datetime, timezone, timedelta
-from app.services.scraping.base import BaseJobScraper
-from app.schemas.job import JobCreate
+from app.services.scraping.base import BaseJobScraper, ScrapedPage
 
 
 class MockJobScraper(BaseJobScraper):
@@ -14,9 +13,19 @@ class MockJobScraper(BaseJobScraper):
     def platform_name(self) -> str:
         return "MockPlatform"
     
-    async def scrape(self, query: str = None, location: str = None) -> List[JobCreate]:
+    async def fetch_page(
+        self,
+        client: httpx.AsyncClient = None,
+        query: str = None,
+        location: str = None,
+        page: int = 0,
+    ) -> ScrapedPage:
         """Return sample mock job data"""
         
+        # All sample jobs fit on the first page
+        if page > 0:
+            return ScrapedPage([], result_count=0)
+        
         # Sample jobs for demonstration
         mock_jobs = [
             {
@@ -87,4 +96,4 @@ class MockJobScraper(BaseJobScraper):
                 if location_lower in job["location"].lower()
             ]
         
-        return [self.normalize_job(job) for job in mock_jobs]
+        return ScrapedPage([self.normalize_job(job) for job in mock_jobs], result_count=len(mock_jobs))
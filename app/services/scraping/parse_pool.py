@@ -0,0 +1,52 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+import asyncio
+import logging
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[Executor] = None
+
+
+def _create_executor() -> Optional[Executor]:
+    kind = settings.SCRAPER_PARSE_EXECUTOR
+    workers = settings.SCRAPER_PARSE_WORKERS
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper-parse")
+    if kind == "inline":
+        return None
+    raise ValueError(f"Unknown SCRAPER_PARSE_EXECUTOR: {kind}")
+
+
+def get_parse_executor() -> Optional[Executor]:
+    """Return the shared parse executor, or None when parsing runs inline"""
+    global _executor
+    if _executor is None:
+        _executor = _create_executor()
+    return _executor
+
+
+async def run_parser(func: Callable[..., Any], *args) -> Any:
+    """
+    Run a CPU-bound parser off the event loop.
+
+    With a process pool, func and its arguments must be picklable
+    (module-level functions and plain data).
+    """
+    if settings.SCRAPER_PARSE_EXECUTOR == "inline":
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_parse_executor(), func, *args)
+
+
+def shutdown_parse_executor():
+    """Stop the shared parse executor's workers"""
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.debug("Parse executor shut down")
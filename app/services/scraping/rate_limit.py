@@ -0,0 +1,134 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+import asyncio
+import random
+import time
+import httpx
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with full jitter for the given retry attempt"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket shared by every concurrent request to one platform.
+
+    The refill rate adapts AIMD-style: it creeps up by `increase` after
+    each successful response and is cut by `decrease_factor` when the
+    site throttles us. A Retry-After pause blocks all callers until it
+    has passed.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: float,
+        max_rate: float,
+        increase: float = 0.05,
+        decrease_factor: float = 0.5,
+    ):
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        self.burst = max(burst, 1)
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.throttled_count = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+
+    def on_success(self):
+        """Probe upwards after a successful request"""
+        self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """Back off after a 429/503, honoring Retry-After when present"""
+        now = time.monotonic()
+        self.throttled_count += 1
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self._tokens = 0.0
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    @property
+    def current_rate(self) -> float:
+        """Currently allowed requests per second"""
+        return self.rate
+
+    def snapshot(self) -> dict:
+        blocked_for = max(self._blocked_until - time.monotonic(), 0.0)
+        return {
+            "rate": round(self.rate, 3),
+            "burst": self.burst,
+            "min_rate": self.min_rate,
+            "max_rate": self.max_rate,
+            "throttled": self.throttled_count,
+            "blocked_for": round(blocked_for, 3),
+        }
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that waits on a rate limiter before each request.
+
+    The limiter travels with the request in its `rate_limiter` extension,
+    so only requests that actually reach the network (not cache hits)
+    consume tokens.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = request.extensions.get("rate_limiter")
+        if limiter is not None:
+            await limiter.acquire()
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self):
+        await self._transport.aclose()
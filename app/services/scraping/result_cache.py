@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, List, Optional, Tuple
+import time
+
+from app.schemas.job import JobCreate
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+@dataclass
+class _Entry:
+    jobs: List[JobCreate]
+    stored_at: float
+
+
+class ScrapeResultCache:
+    """
+    In-memory LRU cache of normalized scrape results.
+
+    Entries are fresh for `ttl` seconds, then stale for another
+    `stale_ttl` seconds: stale results may still be served while a
+    refresh runs in the background. Older entries are dropped.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[List[JobCreate], str]]:
+        """Return (jobs, FRESH or STALE), or None on a miss"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        age = time.monotonic() - entry.stored_at
+        if age >= self.ttl + self.stale_ttl:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        if age < self.ttl:
+            self.hits += 1
+            return list(entry.jobs), FRESH
+        self.stale_hits += 1
+        return list(entry.jobs), STALE
+
+    def set(self, key: Hashable, jobs: List[JobCreate]):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = _Entry(jobs=list(jobs), stored_at=time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0,
+        }
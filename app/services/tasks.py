@@ -0,0 +1,197 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
+import uuid
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.services.ingest import save_scraped_jobs
+from app.services.scraping import scraper_manager
+
+logger = logging.getLogger(__name__)
+
+
+class TaskStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class QueueFullError(Exception):
+    """Raised when the scrape task queue cannot accept more work"""
+    pass
+
+
+@dataclass
+class ScrapeTask:
+    id: str
+    key: Tuple
+    query: Optional[str] = None
+    location: Optional[str] = None
+    platforms: Optional[List[str]] = None
+    max_pages: Optional[int] = None
+    max_results: Optional[int] = None
+    status: TaskStatus = TaskStatus.PENDING
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    job_ids: List[int] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (TaskStatus.SUCCEEDED, TaskStatus.FAILED)
+
+
+def task_key(
+    query: Optional[str],
+    location: Optional[str],
+    platforms: Optional[List[str]],
+    max_pages: Optional[int],
+    max_results: Optional[int],
+) -> Tuple:
+    """Normalized single-flight key for a scrape request"""
+    return (
+        (query or "").strip().lower(),
+        (location or "").strip().lower(),
+        tuple(sorted({p.strip().lower() for p in platforms or []})),
+        max_pages,
+        max_results,
+    )
+
+
+class ScrapeTaskQueue:
+    """
+    Bounded background queue for scrape requests.
+
+    A fixed pool of workers runs queued tasks. Requests with the same
+    normalized parameters as a pending or running task are collapsed
+    into that task instead of scraping the sites again. Finished tasks
+    are kept for SCRAPE_TASK_TTL seconds so clients can fetch results.
+    """
+
+    def __init__(self, workers: int, max_queue: int, ttl: float):
+        self.workers = workers
+        self.ttl = ttl
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._tasks: Dict[str, ScrapeTask] = {}
+        self._in_flight: Dict[Tuple, str] = {}
+        self._workers: List[asyncio.Task] = []
+
+    def start(self):
+        """Start the worker pool"""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"scrape-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def aclose(self):
+        """Stop workers; queued and running tasks are marked failed"""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for task in self._tasks.values():
+            if not task.done:
+                self._finish(task, TaskStatus.FAILED, error="Server shutting down")
+
+    def get(self, task_id: str) -> Optional[ScrapeTask]:
+        self._prune()
+        return self._tasks.get(task_id)
+
+    def submit(
+        self,
+        query: Optional[str] = None,
+        location: Optional[str] = None,
+        platforms: Optional[List[str]] = None,
+        max_pages: Optional[int] = None,
+        max_results: Optional[int] = None,
+    ) -> Tuple[ScrapeTask, bool]:
+        """
+        Queue a scrape, or join an identical one already in flight.
+        Returns (task, created).
+        """
+        self._prune()
+        key = task_key(query, location, platforms, max_pages, max_results)
+        existing_id = self._in_flight.get(key)
+        if existing_id is not None:
+            return self._tasks[existing_id], False
+
+        task = ScrapeTask(
+            id=uuid.uuid4().hex,
+            key=key,
+            query=query,
+            location=location,
+            platforms=platforms,
+            max_pages=max_pages,
+            max_results=max_results,
+        )
+        try:
+            self._queue.put_nowait(task.id)
+        except asyncio.QueueFull:
+            raise QueueFullError("Scrape queue is full")
+
+        self._tasks[task.id] = task
+        self._in_flight[key] = task.id
+        return task, True
+
+    def _finish(self, task: ScrapeTask, status: TaskStatus, error: Optional[str] = None):
+        task.status = status
+        task.error = error
+        task.finished_at = datetime.now(timezone.utc)
+        if self._in_flight.get(task.key) == task.id:
+            del self._in_flight[task.key]
+
+    def _prune(self):
+        now = datetime.now(timezone.utc)
+        expired = [
+            task_id for task_id, task in self._tasks.items()
+            if task.done and (now - task.finished_at).total_seconds() > self.ttl
+        ]
+        for task_id in expired:
+            del self._tasks[task_id]
+
+    async def _run(self, task: ScrapeTask):
+        scraped_jobs = await scraper_manager.scrape_all(
+            query=task.query,
+            location=task.location,
+            max_pages=task.max_pages,
+            max_results=task.max_results,
+            platforms=task.platforms,
+        )
+        async with AsyncSessionLocal() as db:
+            created_jobs = await save_scraped_jobs(db, scraped_jobs)
+            task.job_ids = [job.id for job in created_jobs]
+
+    async def _worker(self, number: int):
+        while True:
+            task_id = await self._queue.get()
+            try:
+                task = self._tasks.get(task_id)
+                if task is None or task.done:
+                    continue
+                task.status = TaskStatus.RUNNING
+                task.started_at = datetime.now(timezone.utc)
+                try:
+                    await self._run(task)
+                except Exception as e:
+                    logger.error(f"Scrape task {task.id} failed: {e}")
+                    self._finish(task, TaskStatus.FAILED, error=str(e))
+                else:
+                    self._finish(task, TaskStatus.SUCCEEDED)
+            finally:
+                self._queue.task_done()
+
+
+# Shared queue instance, started and closed by the app lifespan
+scrape_task_queue = ScrapeTaskQueue(
+    workers=settings.SCRAPE_WORKERS,
+    max_queue=settings.SCRAPE_QUEUE_SIZE,
+    ttl=settings.SCRAPE_TASK_TTL,
+)
@@ -0,0 +1,101 @@
+"""
+Authenticated request throughput with and without the auth caches.
+
+Creates a user with a few applications, then sends GET /auth/me and
+GET /applied-jobs through the API in process, first with the token and
+user caches disabled (jwt.decode and a user query on every request),
+then enabled.
+
+Usage:
+    python -m benchmarks.bench_auth [--requests 2000] [--concurrency 10]
+        [--database-url URL]
+
+Without --database-url a temporary SQLite database is used.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+
+async def seed() -> str:
+    from sqlalchemy import select
+    from app.core.database import AsyncSessionLocal, Base, async_engine
+    from app.core.security import create_access_token, get_password_hash
+    from app.models import AppliedJob, Job, User
+
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        user = await db.scalar(select(User).where(User.email == "bench@example.com"))
+        if user is None:
+            user = User(email="bench@example.com", name="Bench", password_hash=get_password_hash("bench"))
+            db.add(user)
+            await db.flush()
+            for number in range(5):
+                job = Job(title=f"Job {number}", company="Bench Co", dedup_key=f"bench-auth-{number}")
+                db.add(job)
+                await db.flush()
+                db.add(AppliedJob(user_id=user.id, job_id=job.id))
+            await db.commit()
+        return create_access_token(subject=user.id)
+
+
+async def measure(label: str, client, path: str, token: str, requests: int, concurrency: int):
+    headers = {"Authorization": f"Bearer {token}"}
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            response = await client.get(path, headers=headers)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {path:<22} {requests / elapsed:>7.0f} req/s  {elapsed / requests * 1000:6.2f} ms/req")
+
+
+async def run(args):
+    import httpx
+    from app.core.database import async_engine
+    from app.core.principals import user_cache
+    from app.core.security import token_cache
+    from app.main import app
+
+    token = await seed()
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for label, enabled in (("uncached", False), ("cached", True)):
+                token_cache.max_entries = 10000 if enabled else 0
+                user_cache.ttl = 30.0 if enabled else 0.0
+                token_cache.clear()
+                user_cache.clear()
+                for path in ("/api/v1/auth/me", "/api/v1/applied-jobs"):
+                    await measure(label, client, path, token, args.requests, args.concurrency)
+        print(f"\ntoken cache: {token_cache.stats()}\nuser cache:  {user_cache.stats()}")
+    finally:
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    # Must be set before the app (and its engines) are imported
+    if args.database_url is None:
+        args.database_url = "sqlite:///" + os.path.join(tempfile.gettempdir(), "bench_auth.db")
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
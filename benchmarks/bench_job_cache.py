@@ -0,0 +1,174 @@
+"""
+GET /jobs latency with and without the result cache.
+
+Seeds a database with generated jobs, then replays a skewed mix of
+popular searches through the API (in process, no server needed) with
+the cache off, in-process only, Redis only and both tiers. Redis is the
+stand-in from benchmarks/resp_server.py unless --redis-url is given.
+Every --scrape-every requests the cache is invalidated, as a scrape
+that stores new jobs would.
+
+Usage:
+    python -m benchmarks.bench_job_cache [--jobs 20000] [--requests 2000]
+        [--searches 60] [--skew 1.1] [--scrape-every 500]
+        [--redis-latency 0.0002] [--redis-url URL] [--database-url URL]
+
+Without --database-url a temporary SQLite database is used.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+TITLES = ["Software Engineer", "Data Scientist", "Backend Developer", "Frontend Developer",
+          "DevOps Engineer", "Product Manager", "QA Engineer", "ML Engineer"]
+SKILLS = ["Python", "Java", "React", "Go", "Rust", "Kubernetes", "SQL", "Node.js"]
+LOCATIONS = ["Bangalore", "Remote", "New York, NY", "London", "Pune", "Berlin"]
+LEVELS = ["Entry", "Mid", "Senior"]
+
+
+def generate_jobs(count: int):
+    from app.schemas.job import JobCreate
+
+    rng = random.Random(7)
+    now = datetime.now(timezone.utc)
+    for number in range(count):
+        skill = rng.choice(SKILLS)
+        yield JobCreate(
+            title=f"{rng.choice(LEVELS)} {skill} {rng.choice(TITLES)}",
+            company=f"Company {number}",
+            location=rng.choice(LOCATIONS),
+            platform=rng.choice(["LinkedIn", "Naukri", "Unstop"]),
+            description=f"Work on {skill} services. " * 20,
+            posted_date=now - timedelta(hours=rng.randrange(24 * 60)),
+            experience_level=rng.choice(LEVELS),
+        )
+
+
+async def seed(count: int):
+    from app.core.database import AsyncSessionLocal, Base, async_engine
+    from app.models import Job
+    from app.services.ingest import save_scraped_jobs
+    from sqlalchemy import func, select
+
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        existing = await db.scalar(select(func.count(Job.id)))
+        if existing >= count:
+            return existing
+        jobs = list(generate_jobs(count))
+        for start in range(0, len(jobs), 1000):
+            await save_scraped_jobs(db, jobs[start:start + 1000])
+        return await db.scalar(select(func.count(Job.id)))
+
+
+def workload(args):
+    """Request params, popular searches far more often than rare ones"""
+    rng = random.Random(11)
+    searches = []
+    while len(searches) < args.searches:
+        params = {"query": rng.choice(SKILLS)}
+        if rng.random() < 0.5:
+            params["location"] = rng.choice(LOCATIONS)
+        if rng.random() < 0.3:
+            params["skip"] = 20 * rng.randrange(1, 5)
+        if params not in searches:
+            searches.append(params)
+    weights = [1 / (rank + 1) ** args.skew for rank in range(len(searches))]
+    return rng.choices(searches, weights=weights, k=args.requests)
+
+
+async def measure(label: str, cache, requests, scrape_every: int):
+    import httpx
+    from app.main import app
+    from app.services.query_cache import get_job_list_cache
+
+    app.dependency_overrides[get_job_list_cache] = lambda: cache
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        for number, params in enumerate(requests, 1):
+            began = time.perf_counter()
+            response = await client.get("/api/v1/jobs", params=params)
+            latencies.append(time.perf_counter() - began)
+            response.raise_for_status()
+            if scrape_every and number % scrape_every == 0:
+                await cache.invalidate()
+        elapsed = time.perf_counter() - start
+    app.dependency_overrides.pop(get_job_list_cache)
+
+    info = cache.info()
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:<15} {len(requests) / elapsed:>7.0f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:7.2f} ms  p95 {p95 * 1000:7.2f} ms  "
+        f"hit ratio {info['hit_ratio']:.2f}  saved {info['saved_seconds']:.2f}s"
+    )
+    await cache.aclose()
+
+
+async def run(args):
+    from app.core.database import async_engine
+    from app.services.query_cache import QueryResultCache
+    from benchmarks.resp_server import RespServer
+
+    total = await seed(args.jobs)
+    requests = workload(args)
+    print(f"{total} jobs, {len(requests)} requests over {args.searches} searches\n")
+
+    server = None
+    redis_url = args.redis_url
+    if redis_url is None:
+        server = await RespServer(latency=args.redis_latency).start()
+        redis_url = server.url
+
+    modes = [
+        ("off", dict(ttl=0, max_entries=0)),
+        ("memory", dict(ttl=args.ttl, max_entries=1000)),
+        ("redis", dict(ttl=args.ttl, max_entries=0, redis_url=redis_url)),
+        ("memory+redis", dict(ttl=args.ttl, max_entries=1000, redis_url=redis_url)),
+    ]
+    try:
+        for label, options in modes:
+            cache = QueryResultCache(**options)
+            if cache.redis is not None:
+                await cache.redis.execute("FLUSHALL")
+            await measure(label, cache, requests, args.scrape_every)
+    finally:
+        if server is not None:
+            await server.aclose()
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--searches", type=int, default=60, help="distinct searches in the mix")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of search popularity")
+    parser.add_argument("--scrape-every", type=int, default=500, help="requests between invalidations, 0 never")
+    parser.add_argument("--ttl", type=float, default=60.0)
+    parser.add_argument("--redis-latency", type=float, default=0.0002, help="stand-in seconds per command")
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    # Must be set before the app (and its engines) are imported
+    if args.database_url is None:
+        args.database_url = "sqlite:///" + os.path.join(tempfile.gettempdir(), "bench_job_cache.db")
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    os.environ.setdefault("JOB_RETENTION_DAYS", "0")
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+CPU time and payload size of one GET /jobs page at limit=100.
+
+Compares the old response path (ORM entities validated into
+JobListResponse and encoded with the stdlib json module, as FastAPI
+does for a response_model) with the lean path list_jobs uses now
+(projected column rows encoded with orjson), for each description mode.
+The result cache is not involved.
+
+Usage:
+    python -m benchmarks.bench_job_list [--jobs 20000] [--iterations 200]
+        [--limit 100] [--database-url URL]
+
+Without --database-url the temporary SQLite database of
+benchmarks.bench_job_cache is used (and seeded if needed).
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+
+def orm_page(rows, job_count) -> bytes:
+    from fastapi.encoders import jsonable_encoder
+    from app.schemas.job import JobListResponse
+
+    response = JobListResponse(jobs=rows, total=job_count)
+    content = jsonable_encoder(JobListResponse.model_validate(response))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def lean_page(rows, job_count, description) -> bytes:
+    import orjson
+    from app.services.job_search import job_list_rows
+
+    return orjson.dumps({
+        "jobs": job_list_rows(rows, description),
+        "total": job_count,
+        "total_estimated": False,
+        "next_cursor": None,
+    })
+
+
+async def measure(label: str, stmt, render, iterations: int, limit: int):
+    from app.core.database import AsyncSessionLocal
+    from app.services.job_search import count_jobs, page_by_date
+
+    query_cpu = render_cpu = 0.0
+    wall_start = time.perf_counter()
+    for _ in range(iterations):
+        # A fresh session each time, as per request
+        async with AsyncSessionLocal() as db:
+            started = time.process_time()
+            job_count = await count_jobs(db, stmt)
+            rows, _ = await page_by_date(db, stmt, limit)
+            fetched = time.process_time()
+            body = render(rows, job_count)
+            query_cpu += fetched - started
+            render_cpu += time.process_time() - fetched
+    wall = (time.perf_counter() - wall_start) / iterations
+    print(
+        f"{label:<15} wall {wall * 1000:7.2f} ms  cpu: fetch {query_cpu / iterations * 1000:6.2f} ms  "
+        f"encode {render_cpu / iterations * 1000:6.2f} ms  payload {len(body) / 1024:7.1f} KiB"
+    )
+
+
+async def run(args):
+    from sqlalchemy import select
+    from app.core.database import async_engine
+    from app.models import Job
+    from app.services.job_search import job_list_columns
+    from benchmarks.bench_job_cache import seed
+
+    total = await seed(args.jobs)
+    print(f"{total} jobs, {args.iterations} pages of {args.limit}\n")
+    try:
+        await measure("orm+pydantic", select(Job), orm_page, args.iterations, args.limit)
+        for description in ("full", "snippet", "none"):
+            await measure(
+                f"lean {description}",
+                select(*job_list_columns(description)),
+                lambda rows, job_count: lean_page(rows, job_count, description),
+                args.iterations,
+                args.limit,
+            )
+    finally:
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    # Must be set before the app (and its engines) are imported
+    if args.database_url is None:
+        args.database_url = "sqlite:///" + os.path.join(tempfile.gettempdir(), "bench_job_cache.db")
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark LinkedIn card parsing: lxml/XPath vs BeautifulSoup.
+
+Usage:
+    python -m benchmarks.bench_linkedin_parse [--cards 25] [--pages 200]
+"""
+import argparse
+import time
+
+from app.services.scraping.linkedin_parser import parse_cards_lxml, parse_cards_soup
+
+CARD_TEMPLATE = """
+<li>
+  <div class="base-card relative w-full base-search-card base-search-card--link job-search-card" data-entity-urn="urn:li:jobPosting:{n}">
+    <a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="https://in.linkedin.com/jobs/view/software-engineer-{n}?trk=public_jobs">
+      <span class="sr-only">Software Engineer {n}</span>
+    </a>
+    <div class="search-entity-media">
+      <img class="artdeco-entity-image" data-delayed-url="https://media.licdn.com/logo-{n}.png" alt="Company {n}">
+    </div>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">
+            Software Engineer {n}
+      </h3>
+      <h4 class="base-search-card__subtitle">
+        <a class="hidden-nested-link" href="https://in.linkedin.com/company/company-{n}">Company {n}</a>
+      </h4>
+      <div class="base-search-card__metadata">
+        <span class="job-search-card__location">Bengaluru, Karnataka, India</span>
+        <div class="job-posting-benefits text-sm">
+          <icon class="job-posting-benefits__icon"></icon>
+          <span class="job-posting-benefits__text">Actively Hiring</span>
+        </div>
+        <time class="job-search-card__listdate" datetime="2026-10-01">2 weeks ago</time>
+      </div>
+    </div>
+  </div>
+</li>
+"""
+
+
+def make_page(cards: int, offset: int = 0) -> str:
+    return "".join(CARD_TEMPLATE.format(n=offset + i) for i in range(cards))
+
+
+def bench(name: str, parser, pages: list) -> float:
+    start = time.perf_counter()
+    parsed = 0
+    for page in pages:
+        jobs, _ = parser(page, "India")
+        parsed += len(jobs)
+    elapsed = time.perf_counter() - start
+    rate = parsed / elapsed
+    print(f"{name:<6} {parsed:>7} cards in {elapsed:7.3f}s  {rate:>10.0f} cards/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=25, help="cards per page")
+    parser.add_argument("--pages", type=int, default=200, help="pages to parse")
+    args = parser.parse_args()
+
+    pages = [make_page(args.cards, i * args.cards) for i in range(args.pages)]
+
+    # Both parsers must agree before timing them
+    assert parse_cards_lxml(pages[0], "India") == parse_cards_soup(pages[0], "India")
+
+    soup_rate = bench("soup", parse_cards_soup, pages)
+    lxml_rate = bench("lxml", parse_cards_lxml, pages)
+    print(f"speedup: {lxml_rate / soup_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+End-to-end scraper throughput against the offline replay transport.
+
+Measures jobs/second for each scraper and for ScraperManager.scrape_all,
+with caches disabled so every iteration goes through fetch, parse and
+normalize. No network access is needed.
+
+Usage:
+    python -m benchmarks.bench_scrapers [--iterations 20] [--pages 5]
+        [--latency 0.05] [--error-rate 0] [--throttle-rate 0]
+        [--min-jobs-per-sec N]
+
+With --min-jobs-per-sec the script exits non-zero when scrape_all falls
+below the threshold, so it can guard against regressions in CI.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from app.core.config import settings
+from benchmarks.replay import ReplayTransport
+
+
+def configure(args):
+    # Measure the scrape path itself, not the caches in front of it
+    settings.SCRAPER_HTTP_CACHE_ENABLED = False
+    settings.SCRAPER_RESULT_CACHE_MAX_ENTRIES = 0
+    settings.SCRAPER_RATE_LIMIT = args.rate
+    settings.SCRAPER_MAX_RATE_LIMIT = max(args.rate, settings.SCRAPER_MAX_RATE_LIMIT)
+    settings.SCRAPER_RATE_BURST = max(int(args.rate), 1)
+    settings.SCRAPER_BACKOFF_BASE = 0.01
+    settings.SCRAPER_DEFAULT_MAX_PAGES = args.pages
+    settings.SCRAPER_PARSE_EXECUTOR = args.executor
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+async def timed(label: str, make_call, iterations: int) -> float:
+    jobs = 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        jobs += len(await make_call())
+    elapsed = time.perf_counter() - start
+    rate = jobs / elapsed if elapsed else 0.0
+    print(f"{label:<12} {jobs:>7} jobs in {elapsed:7.3f}s  {rate:>9.0f} jobs/s")
+    return rate
+
+
+async def run(args) -> float:
+    from app.services.scraping import ScraperManager
+
+    transport = ReplayTransport(
+        pages=args.pages,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        seed=42,
+    )
+    manager = ScraperManager(network_factory=lambda platform: transport)
+    await manager.start()
+    try:
+        for scraper in manager.scrapers:
+            await timed(scraper.platform_name, lambda s=scraper: s.scrape(), args.iterations)
+        rate = await timed("scrape_all", manager.scrape_all, args.iterations)
+    finally:
+        await manager.aclose()
+
+    stats = transport.stats
+    print(
+        f"replay: {stats.requests} requests, {stats.throttled} throttled, "
+        f"{stats.errors} errors, {stats.bytes_sent / 1024:.0f} KiB"
+    )
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=5, help="full pages per search")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--rate", type=float, default=1000.0, help="rate limit per platform (req/s)")
+    parser.add_argument("--executor", default="thread", choices=["thread", "process", "inline"])
+    parser.add_argument("--min-jobs-per-sec", type=float, default=None)
+    args = parser.parse_args()
+
+    configure(args)
+    rate = asyncio.run(run(args))
+
+    if args.min_jobs_per_sec is not None and rate < args.min_jobs_per_sec:
+        print(f"FAIL: scrape_all {rate:.0f} jobs/s < {args.min_jobs_per_sec:.0f} jobs/s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Check that the hot listing queries use their indexes.
+
+Runs EXPLAIN against DATABASE_URL (Postgres) for the applied-jobs and
+job listing queries and verifies each plan reaches the expected index,
+with an index-only scan where the index covers the query. Sequential
+scans are disabled for the session, so small development tables still
+show whether an index is usable rather than whether it is worth it.
+
+Usage:
+    python -m benchmarks.check_query_plans [--analyze] [--verbose]
+
+Exits non-zero when a query misses its index.
+"""
+from datetime import datetime
+from typing import Iterator, List, Tuple
+import argparse
+import json
+import sys
+
+from sqlalchemy import select, text, tuple_
+
+from app.core.database import engine
+from app.models import AppliedJob, Job
+from app.services.job_search import DATE_ORDER, job_list_columns
+
+USER_ID = 1
+PAGE_SIZE = 20
+
+# As selected and ordered by GET /applied-jobs
+APPLIED_COLUMNS = (AppliedJob.id, AppliedJob.job_id, AppliedJob.applied_at)
+APPLIED_ORDER = (AppliedJob.applied_at.desc(), AppliedJob.id.desc())
+
+# (name, statement, expected index, index-only scan required)
+CHECKS = [
+    (
+        "applied jobs for a user (ids)",
+        select(*APPLIED_COLUMNS)
+        .where(AppliedJob.user_id == USER_ID)
+        .order_by(*APPLIED_ORDER)
+        .limit(PAGE_SIZE + 1),
+        "ix_applied_jobs_user_applied_at",
+        True,
+    ),
+    (
+        "applied jobs, cursor page (with job)",
+        select(*APPLIED_COLUMNS, *job_list_columns())
+        .join(Job, Job.id == AppliedJob.job_id)
+        .where(
+            AppliedJob.user_id == USER_ID,
+            tuple_(AppliedJob.applied_at, AppliedJob.id) < (datetime(2026, 1, 1), 1000),
+        )
+        .order_by(*APPLIED_ORDER)
+        .limit(PAGE_SIZE + 1),
+        "ix_applied_jobs_user_applied_at",
+        True,
+    ),
+    (
+        "jobs, first page",
+        select(Job).order_by(*DATE_ORDER).limit(PAGE_SIZE + 1),
+        "ix_jobs_posted_date_id",
+        False,
+    ),
+    (
+        "jobs, cursor page",
+        select(Job)
+        .where(Job.posted_date.isnot(None), tuple_(Job.posted_date, Job.id) < (datetime(2026, 1, 1), 1000))
+        .order_by(*DATE_ORDER)
+        .limit(PAGE_SIZE + 1),
+        "ix_jobs_posted_date_id",
+        False,
+    ),
+]
+
+
+def walk(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+def explain(conn, stmt) -> dict:
+    compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def check(plan: dict, index: str, index_only: bool) -> Tuple[bool, List[str]]:
+    nodes = [
+        f"{node['Node Type']}" + (f" using {node['Index Name']}" if "Index Name" in node else "")
+        for node in walk(plan)
+    ]
+    expected = {"Index Only Scan"} if index_only else {"Index Scan", "Index Only Scan"}
+    ok = any(
+        node.get("Index Name") == index and node["Node Type"] in expected
+        for node in walk(plan)
+    )
+    return ok, nodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--analyze", action="store_true", help="VACUUM ANALYZE the tables first")
+    parser.add_argument("--verbose", action="store_true", help="print every plan node")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        print(f"Query plan checks need Postgres, not {engine.dialect.name}")
+        sys.exit(2)
+
+    if args.analyze:
+        # Refresh the visibility map so index-only scans are costed as such
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM ANALYZE jobs, applied_jobs"))
+
+    failures = 0
+    with engine.connect() as conn:
+        conn.execute(text("SET enable_seqscan = off"))
+        for name, stmt, index, index_only in CHECKS:
+            ok, nodes = check(explain(conn, stmt), index, index_only)
+            scan = "index-only scan" if index_only else "index scan"
+            print(f"{'PASS' if ok else 'FAIL'}  {name:<36} {scan} on {index}")
+            if args.verbose or not ok:
+                for node in nodes:
+                    print(f"        {node}")
+            failures += not ok
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
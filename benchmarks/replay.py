@@ -0,0 +1,109 @@
+"""
+Offline replay of the job sites for benchmarks and local runs.
+
+ReplayTransport is an httpx transport that answers scraper requests from
+recorded fixtures in benchmarks/fixtures instead of the network. It can
+inject latency, server errors and 429 throttling to exercise the retry
+and rate limiting paths.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+import asyncio
+import json
+import random
+import httpx
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# host -> (fixture file, content type, name of the page parameter, page base)
+ROUTES = {
+    "www.linkedin.com": ("linkedin_search.html", "text/html; charset=utf-8", "start", None),
+    "www.naukri.com": ("naukri_search.json", "application/json", "pageNo", 1),
+    "unstop.com": ("unstop_search.json", "application/json", "page", 1),
+}
+
+EMPTY_BODIES = {
+    "www.linkedin.com": b"",
+    "www.naukri.com": json.dumps({"jobDetails": []}).encode(),
+    "unstop.com": json.dumps({"data": {"data": []}}).encode(),
+}
+
+
+def load_fixtures() -> Dict[str, bytes]:
+    return {host: (FIXTURES_DIR / route[0]).read_bytes() for host, route in ROUTES.items()}
+
+
+@dataclass
+class ReplayStats:
+    requests: int = 0
+    errors: int = 0
+    throttled: int = 0
+    bytes_sent: int = 0
+
+
+@dataclass
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serve recorded search pages for LinkedIn, Naukri and Unstop.
+
+    Args:
+        pages: number of full pages each search has; later pages are empty
+        latency: base response delay in seconds
+        jitter: extra random delay of up to this many seconds
+        error_rate: fraction of requests answered with a 500
+        throttle_rate: fraction of requests answered with a 429
+        retry_after: Retry-After seconds sent with injected 429s
+        seed: seed for the random failure injection
+    """
+    pages: int = 5
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: Optional[float] = 0.1
+    seed: Optional[int] = None
+    stats: ReplayStats = field(default_factory=ReplayStats)
+
+    def __post_init__(self):
+        self._fixtures = load_fixtures()
+        self._random = random.Random(self.seed)
+
+    def _page_number(self, request: httpx.Request, host: str) -> int:
+        _, _, param, base = ROUTES[host]
+        value = int(request.url.params.get(param, base or 0))
+        if base is None:
+            # LinkedIn pages by result offset
+            return value // 10
+        return value - base
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.requests += 1
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        host = request.url.host
+        if host not in ROUTES:
+            return httpx.Response(404, request=request)
+
+        roll = self._random.random()
+        if roll < self.throttle_rate:
+            self.stats.throttled += 1
+            headers = {"Retry-After": str(self.retry_after)} if self.retry_after is not None else {}
+            return httpx.Response(429, headers=headers, request=request)
+        if roll < self.throttle_rate + self.error_rate:
+            self.stats.errors += 1
+            return httpx.Response(500, request=request)
+
+        if self._page_number(request, host) < self.pages:
+            body = self._fixtures[host]
+        else:
+            body = EMPTY_BODIES[host]
+        self.stats.bytes_sent += len(body)
+        return httpx.Response(
+            200,
+            headers={"Content-Type": ROUTES[host][1]},
+            content=body,
+            request=request,
+        )
@@ -0,0 +1,120 @@
+"""
+In-process stand-in for a Redis server, for benchmarks and local runs.
+
+RespServer speaks enough of the Redis protocol (RESP2) for the job
+listing result cache: PING, AUTH, SELECT, GET, SET with EX/PX, INCR,
+DEL and FLUSHALL, with key expiry. It can add a fixed delay per command
+to mimic a network hop.
+
+Usage:
+    python -m benchmarks.resp_server [--port 6379] [--latency 0.0005]
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import time
+
+
+@dataclass
+class RespServer:
+    host: str = "127.0.0.1"
+    port: int = 0
+    latency: float = 0.0
+    commands: int = 0
+    _data: Dict[bytes, Tuple[bytes, Optional[float]]] = field(default_factory=dict)
+
+    async def start(self) -> "RespServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    @property
+    def url(self) -> str:
+        return f"redis://{self.host}:{self.port}/0"
+
+    async def aclose(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def _run(self, args: List[bytes]) -> bytes:
+        name = args[0].upper()
+        if name in (b"PING", b"AUTH", b"SELECT", b"FLUSHALL"):
+            if name == b"FLUSHALL":
+                self._data.clear()
+            return b"+PONG\r\n" if name == b"PING" else b"+OK\r\n"
+        if name == b"GET":
+            value = self._get(args[1])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+        if name == b"SET":
+            expires_at = None
+            options = iter(args[3:])
+            only_new = False
+            for option in options:
+                option = option.upper()
+                if option == b"NX":
+                    only_new = True
+                    continue
+                scale = 1.0 if option == b"EX" else 0.001
+                expires_at = time.monotonic() + int(next(options)) * scale
+            if only_new and self._get(args[1]) is not None:
+                return b"$-1\r\n"
+            self._data[args[1]] = (args[2], expires_at)
+            return b"+OK\r\n"
+        if name == b"INCR":
+            value = int(self._get(args[1]) or 0) + 1
+            self._data[args[1]] = (str(value).encode(), None)
+            return b":%d\r\n" % value
+        if name == b"DEL":
+            return b":%d\r\n" % sum(self._data.pop(key, None) is not None for key in args[1:])
+        return b"-ERR unknown command '%s'\r\n" % args[0]
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                header = await reader.readuntil(b"\r\n")
+                count = int(header[1:-2])
+                args = []
+                for _ in range(count):
+                    size = int((await reader.readuntil(b"\r\n"))[1:-2])
+                    args.append((await reader.readexactly(size + 2))[:-2])
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                self.commands += 1
+                writer.write(self._run(args))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(args):
+    server = await RespServer(port=args.port, latency=args.latency).start()
+    print(f"Listening on {server.url}")
+    await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per command")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()